@@ -0,0 +1,28 @@
+"""
+Application settings.
+Loads .env once at import and exposes environment-derived values as module constants,
+so they are read before any service module needs them and never on a hot path.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# JWT signing key
+SECRET_KEY = os.environ.get("SECRET_KEY", "dev-secret-key-change-in-production")
+
+# bcrypt cost factor for new password hashes (existing hashes keep their own cost)
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+
+# Number of pooled SQLite connections
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+
+# Worker threads for sync handlers and asyncio.to_thread calls (Starlette's default is 40)
+THREADPOOL_SIZE = int(os.environ.get("THREADPOOL_SIZE", "100"))
+
+# Comma-separated allowlist, e.g. "https://stash.example.com,http://localhost:3000"
+CORS_ORIGINS = frozenset(
+    origin.strip() for origin in os.environ.get("CORS_ORIGINS", "*").split(",") if origin.strip()
+)
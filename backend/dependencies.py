@@ -3,6 +3,10 @@
 Provides centralized service initialization and dependency management.
 """
 
+import logging
+from functools import lru_cache
+
+from backend.config import DB_POOL_SIZE
 from backend.metrics import MetricsService
 from backend.services.database import DatabaseService
 from backend.services.groq_summarizer import GroqSummarizer
@@ -10,6 +14,8 @@ from backend.services.user_service import AuthService
 from backend.services.video_service import VideoService
 from backend.services.youtube_fetcher import YouTubeFetcher
 
+logger = logging.getLogger(__name__)
+
 
 class ServiceContainer:
     """Container for managing application services and their dependencies."""
@@ -17,14 +23,14 @@ class ServiceContainer:
     def __init__(self):
         """Initialize services with proper dependency injection."""
         # Infrastructure layer
-        self._db_service = DatabaseService()
+        self._db_service = DatabaseService(pool_size=DB_POOL_SIZE)
         self._youtube_fetcher = YouTubeFetcher()
 
         # Optional services
         try:
             self._groq_summarizer = GroqSummarizer()
         except Exception as e:
-            print(f"Warning: GroqSummarizer not available: {e}")
+            logger.warning("GroqSummarizer not available: %s", e)
             self._groq_summarizer = None
 
         # Business logic layer
@@ -65,28 +71,31 @@ class ServiceContainer:
         return self._groq_summarizer is not None
 
 
-# Global container instance
-_container: ServiceContainer | None = None
-
-
+@lru_cache(maxsize=1)
 def get_container() -> ServiceContainer:
     """Get or create the global service container."""
-    global _container
-    if _container is None:
-        _container = ServiceContainer()
-    return _container
+    return ServiceContainer()
 
 
+@lru_cache(maxsize=1)
 def get_video_service() -> VideoService:
     """FastAPI dependency for video service."""
     return get_container().video_service
 
 
+@lru_cache(maxsize=1)
 def get_auth_service() -> AuthService:
     """FastAPI dependency for auth service."""
     return get_container().auth_service
 
 
+@lru_cache(maxsize=1)
 def get_metrics_service() -> MetricsService:
     """FastAPI dependency for metrics service."""
     return get_container().metrics_service
+
+
+def reset_container() -> None:
+    """Drop the cached container and services (next access rebuilds them)."""
+    for provider in (get_container, get_video_service, get_auth_service, get_metrics_service):
+        provider.cache_clear()
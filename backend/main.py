@@ -4,56 +4,110 @@ Routes delegate to service layer for business logic.
 Follows Single Responsibility and Dependency Inversion principles.
 """
 
+import asyncio
+import contextlib
+import hashlib
 import time
-
-from dotenv import load_dotenv
-from fastapi import Depends, FastAPI, Header, HTTPException
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+import orjson
+from fastapi import (
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, ORJSONResponse
+from pydantic import BaseModel, Field
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from backend.config import CORS_ORIGINS, THREADPOOL_SIZE
 from backend.dependencies import (
     get_auth_service,
     get_container,
     get_metrics_service,
     get_video_service,
+    reset_container,
 )
 from backend.metrics import METRICS_PATH, MetricsService
-from backend.services.auth_service import verify_token
+from backend.services.auth_service import cached_verify_token
+from backend.services.database import PoolTimeoutError
 from backend.services.user_service import AuthService
-from backend.services.video_service import VideoService
+from backend.services.video_service import (
+    TRANSCRIPT_PAGE_SIZE,
+    VideoService,
+    encode_page_cursor,
+)
 
-load_dotenv()
 
-app = FastAPI(title="Stash API", description="Video Content Organizer")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build services, size the thread pools and start background metric flushing."""
+    # Open the DB pool, run schema checks and create the Groq client before the
+    # first request rather than inside it
+    container = get_container()
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    executor = ThreadPoolExecutor(max_workers=THREADPOOL_SIZE, thread_name_prefix="stash")
+    asyncio.get_running_loop().set_default_executor(executor)
+    metrics_flusher = asyncio.create_task(get_metrics_service().run_flush_loop())
+    yield
+    metrics_flusher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await metrics_flusher
+    executor.shutdown(wait=False)
+    container.db_service.close()
+    # The closed pool can't serve another startup in this process (e.g. a
+    # second TestClient), so the next lifespan builds fresh services
+    reset_container()
+
+
+app = FastAPI(
+    title="Stash API",
+    description="Video Content Organizer",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=sorted(CORS_ORIGINS),
+    # Browsers reject credentialed requests against a wildcard origin anyway
+    allow_credentials="*" not in CORS_ORIGINS,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
     """Middleware to record Prometheus metrics for every request."""
 
+    def __init__(self, app, exclude_paths: frozenset[str] = frozenset({METRICS_PATH})):
+        super().__init__(app)
+        self.exclude_paths = exclude_paths
+
     async def dispatch(self, request, call_next):  # type: ignore[override]
+        # Skip excluded paths (the scrape endpoint) before reading the clock or touching labels
+        if request.scope["path"] in self.exclude_paths:
+            return await call_next(request)
+
         start = time.perf_counter()
         response = await call_next(request)
 
         # Prefer route path pattern to reduce label cardinality (e.g. /api/videos/{video_id})
         route = request.scope.get("route")
-        path = getattr(route, "path", request.url.path)
+        path = route.path if route is not None else request.scope["path"]
 
-        # Record metrics (service handles exclusion of metrics endpoint)
-        metrics_service = get_metrics_service()
-        metrics_service.record_request(
-            request.method, path, response.status_code, start, exclude_path=METRICS_PATH
-        )
+        get_metrics_service().record_request(request.method, path, response.status_code, start)
 
         return response
 
@@ -61,6 +115,14 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
 app.add_middleware(PrometheusMiddleware)
 
 
+@app.exception_handler(PoolTimeoutError)
+async def database_busy_handler(request: Request, exc: PoolTimeoutError):
+    """Report an exhausted DB pool as a temporary overload, not a missing resource."""
+    return ORJSONResponse(
+        status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"}
+    )
+
+
 @app.get("/")
 async def read_root():
     """Serve the main frontend page"""
@@ -88,33 +150,56 @@ class VideoRequest(BaseModel):
     url: str
 
 
+# Upper bound on URLs per batch request
+MAX_BATCH_URLS = 50
+# Largest page the video listing will return in one response
+MAX_PAGE_SIZE = 500
+
+
+class BatchVideoRequest(BaseModel):
+    urls: list[str] = Field(min_length=1, max_length=MAX_BATCH_URLS)
+
+
 # Authentication Dependency
-def get_current_user(authorization: str | None = Header(None)):
+_BEARER_PREFIX = "Bearer "
+
+
+async def get_current_user(request: Request, authorization: str | None = Header(None)):
     """
     Dependency that extracts and validates JWT token from request headers.
     Returns user info if token is valid, raises 401 error if not.
+    Async so FastAPI doesn't hop to the threadpool for a (usually cached) HMAC check.
+    The verified user is kept on request.state.user so middleware and other
+    dependencies can read it without parsing the header again.
     """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
     if not authorization:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    try:
-        # Extract token from "Bearer <token>" format
-        scheme, token = authorization.split()
+    # Fast path for the canonical "Bearer <token>" form
+    if authorization.startswith(_BEARER_PREFIX):
+        token = authorization[len(_BEARER_PREFIX) :]
+    else:
+        scheme, separator, token = authorization.partition(" ")
+        if not separator:
+            raise HTTPException(status_code=401, detail="Invalid authorization header")
         if scheme.lower() != "bearer":
-            raise HTTPException(status_code=401, detail="Invalid authentication scheme")
-
-        # Verify token and get user info
-        payload = verify_token(token)
-        if not payload:
-            raise HTTPException(status_code=401, detail="Invalid or expired token")
-
-        return payload  # Returns {"username": "...", "user_id": ...}
+            raise HTTPException(status_code=401, detail="Could not validate credentials")
 
-    except ValueError:
-        raise HTTPException(status_code=401, detail="Invalid authorization header")
+    try:
+        payload = cached_verify_token(token)
     except Exception:
+        payload = None
+
+    if not payload:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
 
+    request.state.user = payload
+    return payload  # Returns {"username": "...", "user_id": ...}
+
 
 # ============================================================================
 # Authentication Endpoints
@@ -122,12 +207,12 @@ def get_current_user(authorization: str | None = Header(None)):
 
 
 @app.post("/api/auth/signup", response_model=TokenResponse)
-def signup(request: SignupRequest, auth_service: AuthService = Depends(get_auth_service)):
+async def signup(request: SignupRequest, auth_service: AuthService = Depends(get_auth_service)):
     """
     Register a new user with username and password.
     Returns JWT token for immediate login.
     """
-    result = auth_service.signup(request.username, request.password)
+    result = await asyncio.to_thread(auth_service.signup, request.username, request.password)
 
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["error"])
@@ -140,12 +225,12 @@ def signup(request: SignupRequest, auth_service: AuthService = Depends(get_auth_
 
 
 @app.post("/api/auth/login", response_model=TokenResponse)
-def login(request: LoginRequest, auth_service: AuthService = Depends(get_auth_service)):
+async def login(request: LoginRequest, auth_service: AuthService = Depends(get_auth_service)):
     """
     Login with username and password.
     Returns JWT token for authenticated requests.
     """
-    result = auth_service.login(request.username, request.password)
+    result = await asyncio.to_thread(auth_service.login, request.username, request.password)
 
     if not result["success"]:
         raise HTTPException(status_code=401, detail=result["error"])
@@ -158,7 +243,7 @@ def login(request: LoginRequest, auth_service: AuthService = Depends(get_auth_se
 
 
 @app.get("/api/auth/me")
-def get_current_user_info(
+async def get_current_user_info(
     current_user: dict = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
 ):
@@ -166,7 +251,7 @@ def get_current_user_info(
     Get information about the currently logged-in user.
     Requires valid JWT token in Authorization header.
     """
-    user = auth_service.get_user_info(current_user["user_id"])
+    user = await asyncio.to_thread(auth_service.get_user_info, current_user["user_id"])
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return {"success": True, "data": user}
@@ -178,8 +263,10 @@ def get_current_user_info(
 
 
 @app.post("/api/videos")
-def save_video_transcript(
+async def save_video_transcript(
     request: VideoRequest,
+    background_tasks: BackgroundTasks,
+    sync: bool = False,
     current_user: dict = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ):
@@ -187,9 +274,15 @@ def save_video_transcript(
     Save a video transcript to database.
     Only accessible with valid JWT token.
     Videos are associated with the logged-in user.
+    The AI summary is generated in the background after the response is sent;
+    poll GET /api/videos/{video_id}/status to pick it up, or pass ?sync=true
+    to summarize before responding.
     """
     try:
-        result = video_service.save_video(request.url, current_user["user_id"])
+        # Transcript fetch and DB writes block, so run them off the event loop
+        result = await asyncio.to_thread(
+            video_service.save_video, request.url, current_user["user_id"], summarize=sync
+        )
 
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result.get("error", "Failed to save video"))
@@ -198,7 +291,21 @@ def save_video_transcript(
         if "message" in result:
             return {"message": result["message"], "data": result["data"]}
 
-        return {"success": True, "message": "Video saved", "data": result["data"]}
+        video_id = result["data"]["video_id"]
+        if result["data"].get("ai_summary"):
+            summary_status = "ready"
+        elif not sync and video_service.summarizer_available:
+            background_tasks.add_task(video_service.summarize_video, video_id)
+            summary_status = "pending"
+        else:
+            summary_status = "unavailable"
+
+        return {
+            "success": True,
+            "message": "Video saved",
+            "data": result["data"],
+            "summary_status": summary_status,
+        }
 
     except HTTPException:
         # Re-raise HTTPException from services (for testing and service layer errors)
@@ -206,56 +313,193 @@ def save_video_transcript(
     except ValueError as e:
         # Invalid URL format
         raise HTTPException(status_code=400, detail=str(e))
+    except PoolTimeoutError:
+        # Reported as 503 by database_busy_handler
+        raise
     except Exception as e:
         error_msg = str(e) if str(e) else f"{type(e).__name__} occurred"
         raise HTTPException(status_code=500, detail=error_msg)
 
 
+@app.post("/api/videos/batch")
+async def save_video_batch(
+    request: BatchVideoRequest,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user),
+    video_service: VideoService = Depends(get_video_service),
+):
+    """
+    Save several video transcripts in one request.
+    Already saved videos are looked up in one query, missing transcripts are
+    fetched concurrently, then all new videos are inserted in a single transaction.
+    Each URL gets its own result so one bad link doesn't fail the batch.
+    AI summaries are generated in the background, as for single saves.
+    """
+    # One result per distinct URL
+    urls = list(dict.fromkeys(request.urls))
+    prepared = await asyncio.to_thread(video_service.prepare_videos, urls, summarize=False)
+
+    # Different URLs can still point at the same video; insert each video once
+    new_videos = {}
+    for result in prepared:
+        if "video_data" in result:
+            new_videos.setdefault(result["video_data"]["video_id"], result["video_data"])
+
+    saved: dict = {}
+    save_error = None
+    if new_videos:
+        save_result = await asyncio.to_thread(
+            video_service.save_videos, list(new_videos.values()), current_user["user_id"]
+        )
+        if save_result["success"]:
+            saved = {row["video_id"]: row for row in save_result["data"]}
+        else:
+            save_error = save_result.get("error", "Failed to save videos")
+
+    summarize = video_service.summarizer_available
+    if summarize:
+        for video_id in saved:
+            background_tasks.add_task(video_service.summarize_video, video_id)
+
+    results = []
+    for url, result in zip(urls, prepared, strict=True):
+        if not result["success"]:
+            results.append({"url": url, "success": False, "error": result.get("error")})
+        elif "video_data" not in result:
+            results.append(
+                {"url": url, "success": True, "message": result["message"], "data": result["data"]}
+            )
+        elif result["video_data"]["video_id"] in saved:
+            results.append(
+                {
+                    "url": url,
+                    "success": True,
+                    "data": saved[result["video_data"]["video_id"]],
+                    "summary_status": "pending" if summarize else "unavailable",
+                }
+            )
+        else:
+            results.append({"url": url, "success": False, "error": save_error})
+
+    return {"success": True, "data": results}
+
+
 @app.get("/api/videos")
-def get_all_videos(
+async def get_all_videos(
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
+    with_transcripts: bool = Query(False),
     current_user: dict = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ):
     """
-    Get all saved videos for the currently logged-in user.
+    Get saved videos for the currently logged-in user, newest first.
     Only returns videos belonging to this user.
+    Pass limit to page through large libraries (default: all videos); paged
+    responses include next_cursor, which fetches the following page in
+    constant time regardless of depth (offset also works but gets slower).
+    with_transcripts=true returns full videos, including raw_transcript, and
+    is always paged (default limit: TRANSCRIPT_PAGE_SIZE).
     """
+    if with_transcripts and limit is None:
+        limit = TRANSCRIPT_PAGE_SIZE
     try:
-        videos = video_service.get_user_videos(current_user["user_id"])
-        return {"success": True, "data": videos}
+        videos = await asyncio.to_thread(
+            video_service.get_user_videos,
+            current_user["user_id"],
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            with_transcripts=with_transcripts,
+        )
+        if limit is None:
+            return {"success": True, "data": videos}
+        next_cursor = encode_page_cursor(videos[-1]) if len(videos) == limit else None
+        return {"success": True, "data": videos, "next_cursor": next_cursor}
+    except ValueError as e:
+        # Malformed page cursor
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         # Re-raise HTTPException from services
         raise
+    except PoolTimeoutError:
+        # Reported as 503 by database_busy_handler
+        raise
     except Exception as e:
         error_msg = str(e) if str(e) else f"{type(e).__name__} occurred"
         raise HTTPException(status_code=500, detail=error_msg)
 
 
+def _video_etag(video: dict) -> str:
+    """Build an ETag from the fields that can change after a video is saved."""
+    digest = hashlib.blake2b(digest_size=8)
+    for field in ("video_id", "updated_at", "title", "ai_summary", "summary_status"):
+        digest.update(str(video.get(field)).encode())
+        digest.update(b"\x00")
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Check an If-None-Match header (possibly a list or weak tags) against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return any(tag in (etag, "*") for tag in candidates)
+
+
 @app.get("/api/videos/{video_id}")
-def get_video(
+async def get_video(
     video_id: str,
+    response: Response,
+    if_none_match: str | None = Header(None),
     current_user: dict = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ):
     """
     Get specific video by ID.
     Only accessible if video belongs to the logged-in user.
+    Supports conditional GET: returns 304 when If-None-Match matches the ETag.
     """
-    video = video_service.get_video(video_id, current_user["user_id"])
+    video = await asyncio.to_thread(video_service.get_video, video_id, current_user["user_id"])
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
+    etag = _video_etag(video)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+    if _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=cache_headers)
+
+    response.headers.update(cache_headers)
     return {"success": True, "data": video}
 
 
+@app.get("/api/videos/{video_id}/status")
+async def get_video_status(
+    video_id: str,
+    current_user: dict = Depends(get_current_user),
+    video_service: VideoService = Depends(get_video_service),
+):
+    """
+    Get processing status of a saved video (e.g. whether its AI summary is ready).
+    Only accessible if video belongs to the logged-in user.
+    """
+    status = await asyncio.to_thread(
+        video_service.get_video_status, video_id, current_user["user_id"]
+    )
+    if not status:
+        raise HTTPException(status_code=404, detail="Video not found")
+    return {"success": True, "data": status}
+
+
 @app.delete("/api/videos/{video_id}")
-def delete_video(
+async def delete_video(
     video_id: str,
     current_user: dict = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ):
     """Delete a video (only if it belongs to current user)"""
-    result = video_service.delete_video(video_id, current_user["user_id"])
+    result = await asyncio.to_thread(video_service.delete_video, video_id, current_user["user_id"])
 
     if not result["success"]:
         error = result["error"]
@@ -270,14 +514,16 @@ def delete_video(
 
 
 @app.put("/api/videos/{video_id}")
-def update_video(
+async def update_video(
     video_id: str,
     request: dict,
     current_user: dict = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ):
     """Update video summary/notes (only if it belongs to current user)"""
-    result = video_service.update_video(video_id, current_user["user_id"], request)
+    result = await asyncio.to_thread(
+        video_service.update_video, video_id, current_user["user_id"], request
+    )
 
     if not result["success"]:
         error = result["error"]
@@ -296,18 +542,26 @@ def update_video(
 # ============================================================================
 
 
+# The health body only depends on whether a summarizer is configured, so both
+# variants are serialized once instead of on every load-balancer probe
+_HEALTH_BODIES = {
+    available: orjson.dumps(
+        {"status": "healthy", "service": "stash-api", "groq_summarizer": available}
+    )
+    for available in (True, False)
+}
+
+
 @app.get("/api/health")
-def health_check():
+async def health_check():
     """
     Check if the API is running and which services are available.
     Public endpoint - no authentication required.
     """
-    container = get_container()
-    return {
-        "status": "healthy",
-        "service": "stash-api",
-        "groq_summarizer": container.summarizer_available,
-    }
+    return Response(
+        content=_HEALTH_BODIES[get_container().summarizer_available],
+        media_type="application/json",
+    )
 
 
 # ============================================================================
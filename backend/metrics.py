@@ -5,9 +5,13 @@ Provides Prometheus-style metrics collection following best practices:
 Uses explicit CollectorRegistry for predictable behavior in containerized environments.
 """
 
+import asyncio
 import time
+from collections import deque
+from collections.abc import Iterator
+from functools import lru_cache
 
-from fastapi import Response
+from fastapi.responses import StreamingResponse
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
     CollectorRegistry,
@@ -19,6 +23,28 @@ from prometheus_client import (
 # Metrics endpoint path - defined here so metrics module owns its configuration
 METRICS_PATH = "/api/metrics"
 
+# Buffered samples are folded into the collectors every FLUSH_INTERVAL_SECONDS,
+# or inline once FLUSH_THRESHOLD samples are pending (bounds memory if no loop runs)
+FLUSH_INTERVAL_SECONDS = 1.0
+FLUSH_THRESHOLD = 1024
+
+# Bound (method, path, status) label children kept per service
+LABEL_CACHE_SIZE = 4096
+
+_perf_counter = time.perf_counter
+
+
+class _SingleFamily:
+    """Registry stand-in exposing one metric family to generate_latest."""
+
+    __slots__ = ("family",)
+
+    def __init__(self, family):
+        self.family = family
+
+    def collect(self):
+        return [self.family]
+
 
 class MetricsService:
     """Service for collecting and exposing Prometheus metrics."""
@@ -51,52 +77,93 @@ class MetricsService:
             registry=self.registry,
         )
 
-    def record_request(
-        self,
-        method: str,
-        path: str,
-        status_code: int,
-        start_time: float,
-        exclude_path: str | None = None,
-    ) -> None:
+        # Pending (method, path, status_code, duration) samples; deque append and
+        # popleft are atomic, so the request path never takes a lock
+        self._buffer: deque[tuple[str, str, int, float]] = deque()
+
+        # .labels() hashes and looks up the label set on every call; bind once per series
+        self._children = lru_cache(maxsize=LABEL_CACHE_SIZE)(self._bind_children)
+
+    def _bind_children(self, method: str, path: str, status_code: int) -> tuple:
+        """Resolve the labelled collectors for one (method, path, status) series."""
+        status_str = str(status_code)
+        errors = None
+        if 400 <= status_code < 600:
+            errors = self.http_errors_total.labels(method, path, status_str)
+        return (
+            self.http_requests_total.labels(method, path, status_str),
+            self.http_request_duration_seconds.labels(method, path, status_str),
+            errors,
+        )
+
+    def record_request(self, method: str, path: str, status_code: int, start_time: float) -> None:
         """
         Record metrics for a completed HTTP request.
+        The sample is buffered and applied to the collectors on the next flush.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             path: Request path pattern
             status_code: HTTP response status code
             start_time: Request start timestamp from time.perf_counter()
-            exclude_path: Optional path to exclude from metrics (e.g., metrics endpoint itself)
-        """
-        # Skip metrics endpoint itself to prevent self-scrape pollution
-        if exclude_path and path == exclude_path:
-            return
-
-        duration = time.perf_counter() - start_time
-        status_str = str(status_code)
 
-        # Record request count
-        self.http_requests_total.labels(method=method, path=path, status_code=status_str).inc()
-
-        # Record request duration
-        self.http_request_duration_seconds.labels(
-            method=method, path=path, status_code=status_str
-        ).observe(duration)
-
-        # Record errors (4xx and 5xx)
-        if 400 <= status_code < 600:
-            self.http_errors_total.labels(method=method, path=path, status_code=status_str).inc()
-
-    def get_metrics_response(self) -> Response:
+        Excluded paths (the metrics endpoint itself) are filtered out by
+        PrometheusMiddleware before it times the request.
+        """
+        self._buffer.append((method, path, status_code, _perf_counter() - start_time))
+        if len(self._buffer) >= FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self) -> None:
+        """Drain buffered samples into the Prometheus collectors."""
+        durations: dict[tuple[str, str, int], list[float]] = {}
+        popleft = self._buffer.popleft
+        while True:
+            try:
+                method, path, status_code, duration = popleft()
+            except IndexError:
+                break
+            durations.setdefault((method, path, status_code), []).append(duration)
+
+        for series, series_durations in durations.items():
+            requests, histogram, errors = self._children(*series)
+            count = len(series_durations)
+
+            # Record request count
+            requests.inc(count)
+
+            # Record request duration
+            for duration in series_durations:
+                histogram.observe(duration)
+
+            # Record errors (4xx and 5xx)
+            if errors is not None:
+                errors.inc(count)
+
+    async def run_flush_loop(self, interval: float = FLUSH_INTERVAL_SECONDS) -> None:
+        """Flush buffered samples periodically until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                self.flush()
+        finally:
+            self.flush()
+
+    def iter_metrics(self) -> Iterator[bytes]:
+        """Yield the Prometheus text exposition one metric family at a time."""
+        self.flush()
+        for family in self.registry.collect():
+            yield generate_latest(_SingleFamily(family))
+
+    def get_metrics_response(self) -> StreamingResponse:
         """
         Generate Prometheus exposition format response.
+        Streams one family per chunk so a scrape never holds the whole output in memory.
 
         Returns:
-            FastAPI Response with metrics in Prometheus text format
+            FastAPI StreamingResponse with metrics in Prometheus text format
         """
-        output = generate_latest(self.registry)
-        return Response(content=output, media_type=CONTENT_TYPE_LATEST)
+        return StreamingResponse(self.iter_metrics(), media_type=CONTENT_TYPE_LATEST)
 
 
 # Global metrics service instance
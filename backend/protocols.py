@@ -4,7 +4,7 @@ These define the contracts that implementations must follow,
 enabling easy swapping of implementations and better testability.
 """
 
-from typing import Protocol
+from typing import Any, Protocol
 
 
 class VideoFetcher(Protocol):
@@ -14,10 +14,12 @@ class VideoFetcher(Protocol):
         """Extract video ID from URL."""
         ...
 
-    def get_transcript(self, url: str) -> dict:
+    def get_transcript(self, url: str, video_id: str | None = None) -> dict:
         """
         Fetch transcript for the given URL.
 
+        video_id, if the caller already extracted it, skips parsing the URL again.
+
         Returns dict with:
         - success: bool
         - video_id: str | None
@@ -29,6 +31,13 @@ class VideoFetcher(Protocol):
         """
         ...
 
+    def get_transcripts(self, urls: list[str], video_ids: list[str] | None = None) -> list[dict]:
+        """Fetch transcripts for several URLs concurrently (one result per URL, in order).
+
+        video_ids, if already extracted (parallel to urls), skips parsing the URLs again.
+        """
+        ...
+
     def can_handle(self, url: str) -> bool:
         """Check if this fetcher can handle the given URL."""
         ...
@@ -72,20 +81,51 @@ class VideoRepository(Protocol):
         """Save video to storage."""
         ...
 
+    def save_videos(self, videos: list[dict], user_id: int, skip_existing: bool = False) -> dict:
+        """Save several videos in one transaction (all or nothing unless skip_existing)."""
+        ...
+
     def get_video_by_id(self, video_id: str) -> dict | None:
         """Retrieve video by ID."""
         ...
 
-    def get_user_videos(self, user_id: int) -> list[dict]:
-        """Get all videos for a user."""
+    def get_videos_by_ids(self, video_ids: list[str]) -> list[dict]:
+        """Retrieve the stored videos among the given IDs (list fields only)."""
+        ...
+
+    def get_user_videos(
+        self,
+        user_id: int,
+        limit: int | None = None,
+        offset: int = 0,
+        before: tuple[str, int] | None = None,
+    ) -> list[dict]:
+        """Get a user's videos, newest first (list fields only, without raw_transcript).
+
+        before=(created_at, id) starts the page right after that row (keyset paging).
+        """
         ...
 
-    def delete_video(self, video_id: str) -> dict:
-        """Delete video by ID."""
+    def get_user_videos_full(
+        self,
+        user_id: int,
+        limit: int = 50,
+        offset: int = 0,
+        before: tuple[str, int] | None = None,
+    ) -> list[dict]:
+        """Like get_user_videos, but full rows including raw_transcript (always paged)."""
         ...
 
-    def update_video(self, video_id: str, updates: dict) -> dict:
-        """Update video fields."""
+    def delete_video(self, video_id: str, user_id: int | None = None) -> dict:
+        """Delete video by ID (only if owned by user_id, when given)."""
+        ...
+
+    def update_video(self, video_id: str, updates: dict, user_id: int | None = None) -> dict:
+        """Update video fields (only if owned by user_id, when given)."""
+        ...
+
+    def finish_summary(self, video_id: str, ai_summary: str | None) -> dict:
+        """Store a background summary (None if it failed) and clear its pending status."""
         ...
 
 
@@ -103,3 +143,19 @@ class UserRepository(Protocol):
     def get_user_by_id(self, user_id: int) -> dict | None:
         """Get user by ID."""
         ...
+
+
+class Cache(Protocol):
+    """Protocol for a key-value cache (in-process, Redis, disk, ...)."""
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value, expiring after ttl seconds (None: implementation default)."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        ...
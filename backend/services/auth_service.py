@@ -1,26 +1,66 @@
-import os
+import hashlib
+import hmac
+import secrets
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 
+import bcrypt
+from cachetools import TLRUCache, TTLCache
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from backend.config import BCRYPT_ROUNDS, SECRET_KEY
 
 # JWT settings
-SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
+# HS256 (HMAC) is a symmetric MAC and verifies faster than RS256 or EdDSA
 ALGORITHM = "HS256"
+_ALLOWED_ALGORITHMS = [ALGORITHM]
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Verified-token cache. Bearer tokens are reused for their whole lifetime, so
+# repeat requests skip signature verification. Trade-off: a revoked token keeps
+# working for up to TOKEN_CACHE_TTL_SECONDS (there is no revocation list today).
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 30
+
+# Successful password checks are remembered briefly: an exact repeat of a
+# (stored hash, password) pair within PASSWORD_CACHE_TTL_SECONDS skips bcrypt.
+# Failed checks are never cached, so wrong guesses always pay for bcrypt. Keys
+# are HMACs under a random key that lives only in this process's memory.
+PASSWORD_CACHE_MAXSIZE = 2048
+PASSWORD_CACHE_TTL_SECONDS = 60
+_password_cache_key = secrets.token_bytes(32)
+_password_cache: TTLCache = TTLCache(maxsize=PASSWORD_CACHE_MAXSIZE, ttl=PASSWORD_CACHE_TTL_SECONDS)
+_password_cache_lock = threading.Lock()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against its hash (successes are cached briefly)"""
+    key = hmac.digest(
+        _password_cache_key,
+        f"{hashed_password}\x00{plain_password}".encode(),
+        "sha256",
+    )
+    with _password_cache_lock:
+        if key in _password_cache:
+            return True
+
+    try:
+        valid = bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        # Malformed stored hash
+        return False
+    if not valid:
+        return False
+
+    with _password_cache_lock:
+        _password_cache[key] = True
+    return True
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password for storage"""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -36,16 +76,62 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     return encoded_jwt
 
 
-def verify_token(token: str) -> dict | None:
-    """Verify JWT token and return payload"""
+def _decode_token(token: str) -> tuple[dict, float | None] | None:
+    """Verify JWT token and return (user payload, exp timestamp)"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=_ALLOWED_ALGORITHMS)
         username: str = payload.get("sub")
         user_id: int = payload.get("user_id")
 
         if username is None or user_id is None:
             return None
 
-        return {"username": username, "user_id": user_id}
+        return {"username": username, "user_id": user_id}, payload.get("exp")
     except JWTError:
         return None
+
+
+def verify_token(token: str) -> dict | None:
+    """Verify JWT token and return payload"""
+    decoded = _decode_token(token)
+    return decoded[0] if decoded else None
+
+
+def _token_ttu(_key: bytes, value: tuple[dict, float | None], now: float) -> float:
+    """Expire cache entries at the token's own `exp`, capped by the cache TTL."""
+    _payload, exp = value
+    ttl = TOKEN_CACHE_TTL_SECONDS
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    return now + ttl
+
+
+_token_cache: TLRUCache = TLRUCache(maxsize=TOKEN_CACHE_MAXSIZE, ttu=_token_ttu)
+_token_cache_lock = threading.Lock()
+
+
+def cached_verify_token(token: str) -> dict | None:
+    """Verify JWT token, serving repeat tokens from an in-process TTL cache.
+
+    Entries are keyed by a SHA-256 digest of the token (the raw token is never
+    stored). Failed verifications are not cached.
+    """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        return cached[0]
+
+    decoded = _decode_token(token)
+    if decoded is None:
+        return None
+
+    with _token_cache_lock:
+        _token_cache[key] = decoded
+    return decoded[0]
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token verifications."""
+    with _token_cache_lock:
+        _token_cache.clear()
@@ -0,0 +1,41 @@
+"""In-process cache implementing the Cache protocol."""
+
+import threading
+import time
+from typing import Any
+
+from cachetools import LRUCache
+
+
+class MemoryCache:
+    """Thread-safe LRU cache with per-entry expiry.
+
+    Stands in for an external cache (Redis, diskcache, ...) behind the same
+    `Cache` protocol; entries only live as long as the process.
+    """
+
+    def __init__(self, maxsize: int = 1024, default_ttl: float | None = None) -> None:
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._default_ttl = default_ttl
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = self._default_ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
@@ -1,21 +1,301 @@
+import atexit
+import contextlib
+import queue
 import sqlite3
+import threading
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
+from cachetools import TTLCache
+
+DEFAULT_POOL_SIZE = 5
+POOL_TIMEOUT_SECONDS = 5.0
+# Per-connection prepared statement cache (sqlite3 default is 128)
+CACHED_STATEMENTS = 512
+
+# Bump whenever _init_database changes so existing databases re-run the DDL once
+SCHEMA_VERSION = 4
+
+# Users are effectively immutable, so lookups by id are served from a short-lived
+# cache. Lookups by username return the password hash and are never cached.
+USER_CACHE_MAXSIZE = 5000
+USER_CACHE_TTL_SECONDS = 60
+
+# Default page size for listings that include transcripts
+FULL_VIDEO_PAGE_SIZE = 50
+
+# Transcripts are long, repetitive text, so all but short ones are stored
+# zlib-compressed (several times smaller). They go in raw_transcript as a BLOB;
+# SQLite columns aren't strictly typed, and older TEXT rows read back unchanged.
+TRANSCRIPT_COMPRESS_MIN_CHARS = 1024
+TRANSCRIPT_COMPRESS_LEVEL = 6
+
+# Applied to every pooled connection (these settings are per connection): NORMAL
+# sync is durable under WAL except on power loss, a ~20 MB page cache keeps hot
+# pages in memory, and reads of the first 256 MB go through a shared memory map
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# INSERT/UPDATE ... RETURNING (SQLite 3.35+) saves the follow-up SELECT on writes
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_RETURNING_ALL = " RETURNING *" if _SUPPORTS_RETURNING else ""
+_RETURNING_USER = " RETURNING id, username, created_at" if _SUPPORTS_RETURNING else ""
+
+# Columns served to list views; raw_transcript is only returned by get_video_by_id
+VIDEO_LIST_COLUMNS = (
+    "id",
+    "url",
+    "video_id",
+    "platform",
+    "title",
+    "ai_summary",
+    "language",
+    "is_generated",
+    "segments_count",
+    "user_id",
+    "created_at",
+    "updated_at",
+)
+_VIDEO_LIST_SELECT = ", ".join(VIDEO_LIST_COLUMNS)
+
+# SQL statements are built once so sqlite3's statement cache sees identical strings
+_VIDEO_INSERT_COLUMNS = (
+    "url, video_id, platform, raw_transcript, ai_summary, language, "
+    "is_generated, segments_count, user_id, summary_status"
+)
+_VIDEO_INSERT_ROW = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_SQL_INSERT_VIDEO = (
+    f"INSERT INTO saved_videos ({_VIDEO_INSERT_COLUMNS}) VALUES {_VIDEO_INSERT_ROW}"
+    + _RETURNING_ALL
+)
+# Bulk inserts bind many rows per statement; stay under SQLite's default limit of
+# 999 host parameters, which also bounds the number of distinct statements built
+_MAX_SQL_VARIABLES = 999
+_BULK_INSERT_CHUNK = _MAX_SQL_VARIABLES // _VIDEO_INSERT_ROW.count("?")
+_SQL_GET_VIDEO_BY_ROWID = "SELECT * FROM saved_videos WHERE id = ?"
+_SQL_GET_VIDEO_BY_ID = "SELECT * FROM saved_videos WHERE video_id = ?"
+# LIMIT -1 means "no limit" in SQLite, so paged and unpaged listings share one statement.
+# id breaks created_at ties (second resolution) so keyset pages never skip rows.
+_SQL_GET_USER_VIDEOS = (
+    f"SELECT {_VIDEO_LIST_SELECT} FROM saved_videos WHERE user_id = ? "
+    "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+)
+# Keyset page: rows strictly after (created_at, id) in listing order
+_SQL_GET_USER_VIDEOS_BEFORE = (
+    f"SELECT {_VIDEO_LIST_SELECT} FROM saved_videos WHERE user_id = ? "
+    "AND (created_at, id) < (?, ?) "
+    "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+)
+# Full rows (with raw_transcript) for clients that want the whole page at once
+_SQL_GET_USER_VIDEOS_FULL = (
+    "SELECT * FROM saved_videos WHERE user_id = ? "
+    "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+)
+_SQL_GET_USER_VIDEOS_FULL_BEFORE = (
+    "SELECT * FROM saved_videos WHERE user_id = ? "
+    "AND (created_at, id) < (?, ?) "
+    "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+)
+_SQL_GET_ALL_VIDEOS = f"SELECT {_VIDEO_LIST_SELECT} FROM saved_videos ORDER BY created_at DESC"
+# Only these fields may be updated. A single statement serves every combination:
+# each field binds a "was given" flag plus its value, so explicit NULLs still apply
+_UPDATABLE_VIDEO_FIELDS = ("ai_summary", "title")
+_SQL_UPDATE_VIDEO_WHERE_ID = (
+    "UPDATE saved_videos SET "
+    + ", ".join(
+        f"{field} = CASE WHEN ? THEN ? ELSE {field} END" for field in _UPDATABLE_VIDEO_FIELDS
+    )
+    + ", updated_at = CURRENT_TIMESTAMP WHERE video_id = ?"
+)
+_SQL_UPDATE_VIDEO = _SQL_UPDATE_VIDEO_WHERE_ID + _RETURNING_ALL
+# Owner-scoped variants check ownership in the same statement as the write
+_SQL_UPDATE_VIDEO_OF_USER = _SQL_UPDATE_VIDEO_WHERE_ID + " AND user_id = ?" + _RETURNING_ALL
+# Store a background summary (None keeps the current one) and end its pending state
+_SQL_FINISH_SUMMARY = (
+    "UPDATE saved_videos SET ai_summary = COALESCE(?, ai_summary), summary_status = NULL, "
+    "updated_at = CURRENT_TIMESTAMP WHERE video_id = ?" + _RETURNING_ALL
+)
+_SQL_DELETE_VIDEO = "DELETE FROM saved_videos WHERE video_id = ?"
+_SQL_DELETE_VIDEO_OF_USER = _SQL_DELETE_VIDEO + " AND user_id = ?"
+_SQL_INSERT_USER = "INSERT INTO users (username, hashed_password) VALUES (?, ?)" + _RETURNING_USER
+_SQL_GET_USER_BY_ID = "SELECT id, username, created_at FROM users WHERE id = ?"
+_SQL_GET_USER_BY_USERNAME = "SELECT * FROM users WHERE username = ?"
+
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """No pooled connection became free in time (the database is overloaded).
+
+    Read methods turn other failures into "not found" results, but let this
+    propagate so callers report an error instead of a false 404 or empty list.
+    """
+
+
+def _row_dict(cursor: sqlite3.Cursor, row: tuple) -> dict[str, Any]:
+    """Build a dict from a plain tuple row using the cursor's column names."""
+    return dict(zip([column[0] for column in cursor.description], row, strict=True))
+
+
+def _row_dicts(cursor: sqlite3.Cursor, rows: list[tuple]) -> list[dict[str, Any]]:
+    """Build dicts for many rows, resolving the column names once."""
+    if not rows:
+        return []
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
+def _pack_transcript(transcript: str | None) -> str | bytes | None:
+    """Compress a transcript for storage (short ones are kept as text)."""
+    if transcript is None or len(transcript) < TRANSCRIPT_COMPRESS_MIN_CHARS:
+        return transcript
+    return zlib.compress(transcript.encode(), TRANSCRIPT_COMPRESS_LEVEL)
+
+
+def _unpack_transcript(video: dict[str, Any]) -> dict[str, Any]:
+    """Decompress a video row's raw_transcript in place if it is stored compressed."""
+    transcript = video.get("raw_transcript")
+    if isinstance(transcript, bytes):
+        video["raw_transcript"] = zlib.decompress(transcript).decode()
+    return video
+
+
+@lru_cache(maxsize=2 * _BULK_INSERT_CHUNK)
+def _bulk_insert_sql(rows: int, skip_existing: bool) -> str:
+    """Build a multi-row INSERT for `rows` videos."""
+    verb = "INSERT OR IGNORE" if skip_existing else "INSERT"
+    values = ", ".join([_VIDEO_INSERT_ROW] * rows)
+    return f"{verb} INTO saved_videos ({_VIDEO_INSERT_COLUMNS}) VALUES {values}"
+
+
+@lru_cache(maxsize=64)
+def _select_videos_by_ids_sql(count: int) -> str:
+    """Build a list-columns SELECT for `count` video IDs."""
+    placeholders = ", ".join("?" * count)
+    return f"SELECT {_VIDEO_LIST_SELECT} FROM saved_videos WHERE video_id IN ({placeholders})"
+
+
+def _video_params(video_data: dict[str, Any], user_id: int) -> tuple:
+    """Map a video dict onto the INSERT parameter order."""
+    return (
+        video_data["url"],
+        video_data["video_id"],
+        video_data.get("platform", "youtube"),
+        _pack_transcript(video_data["raw_transcript"]),
+        video_data.get("ai_summary"),
+        video_data.get("language"),
+        video_data.get("is_generated"),
+        video_data.get("segments_count"),
+        user_id,
+        video_data.get("summary_status"),
+    )
+
 
 class DatabaseService:
-    def __init__(self, db_path: str = "stash.db"):
+    def __init__(self, db_path: str = "stash.db", pool_size: int = DEFAULT_POOL_SIZE):
         self.db_path = db_path
+        # Each ":memory:" connection is a separate database, so it can't be pooled
+        self.pool_size = 1 if db_path == ":memory:" else max(1, pool_size)
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=self.pool_size)
+
+        # Only found users are cached, so a signup is visible immediately
+        self._user_by_id: TTLCache = TTLCache(
+            maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL_SECONDS
+        )
+        self._user_cache_lock = threading.RLock()
+        self._write_lock = threading.Lock()
+
+        # Set up the schema on a single connection first: connections opened
+        # before the DDL keep planning against the old schema (no new indexes)
+        self._pool.put(self._open_connection())
+        atexit.register(self.close)
         self._init_database()
 
-    def _connect(self) -> sqlite3.Connection:
-        """Create a connection with row_factory set to sqlite3.Row."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        # Then warm the rest of the pool so the first requests don't pay for connects
+        for _ in range(self.pool_size - 1):
+            self._pool.put(self._open_connection())
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Create a tuned connection (rows come back as plain tuples)."""
+        # Pooled connections are handed between worker threads (one at a time)
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
+    def _checkout(self) -> sqlite3.Connection:
+        """Take a connection from the pool, replacing it if it has been closed."""
+        try:
+            conn = self._pool.get(timeout=POOL_TIMEOUT_SECONDS)
+        except queue.Empty:
+            raise PoolTimeoutError("Timed out waiting for a database connection") from None
+        try:
+            # Pre-ping without a query: attribute access fails on a closed handle
+            conn.total_changes  # noqa: B018
+        except sqlite3.ProgrammingError:
+            conn = self._open_connection()
+        return conn
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection; commits on success, rolls back on error."""
+        conn = self._checkout()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection for a write; one writer at a time per process.
+
+        SQLite allows a single writer anyway, so queueing on a lock is cheaper
+        than letting writers contend for the database lock and busy-wait.
+        """
+        with self._write_lock, self._connect() as conn:
+            yield conn
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        atexit.unregister(self.close)
+        optimized = False
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            if not optimized:
+                # Refresh planner statistics for tables whose shape changed a lot
+                optimized = True
+                with contextlib.suppress(sqlite3.Error):
+                    conn.execute("PRAGMA optimize")
+            conn.close()
+
     def _init_database(self):
-        """Create tables if they don't exist"""
+        """Create tables if they don't exist (skipped once the schema is current)"""
         with self._connect() as conn:
+            # WAL lets readers proceed during a write; the mode is stored in the
+            # database file, so setting it once here covers every connection
+            if self.db_path != ":memory:":
+                conn.execute("PRAGMA journal_mode = WAL")
+
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return
+
+            # Take the write lock first so concurrently starting workers run the DDL once
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return
+
             cursor = conn.cursor()
 
             # users table
@@ -46,64 +326,139 @@ class DatabaseService:
                     user_id INTEGER,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    summary_status TEXT,
                     FOREIGN KEY (user_id) REFERENCES users(id)
                 )
             """)
+            # Tables created before summary_status existed get it added
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(saved_videos)")}
+            if "summary_status" not in columns:
+                cursor.execute("ALTER TABLE saved_videos ADD COLUMN summary_status TEXT")
 
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_video_id ON saved_videos(video_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_id ON saved_videos(user_id)")
+            # (user_id, created_at DESC, id DESC) serves get_user_videos in order without
+            # a sort, including keyset pages; it also covers plain user_id lookups, so
+            # the old single-column index goes (as does the id-less first version)
+            cursor.execute("DROP INDEX IF EXISTS idx_user_created")
+            cursor.execute(
+                "CREATE INDEX idx_user_created ON saved_videos(user_id, created_at DESC, id DESC)"
+            )
+            cursor.execute("DROP INDEX IF EXISTS idx_user_id")
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_created_at ON saved_videos(created_at DESC)"
             )
 
+            # Give the planner real statistics so it prefers idx_user_created
+            cursor.execute("ANALYZE")
+
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     def save_video(self, video_data: dict[str, Any], user_id: int) -> dict[str, Any]:
         """Save a video to the database with user_id"""
         try:
-            with self._connect() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO saved_videos
-                    (url, video_id, platform, raw_transcript, ai_summary, language, is_generated, segments_count, user_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        video_data["url"],
-                        video_data["video_id"],
-                        video_data.get("platform", "youtube"),
-                        video_data["raw_transcript"],
-                        video_data.get("ai_summary"),
-                        video_data.get("language"),
-                        video_data.get("is_generated"),
-                        video_data.get("segments_count"),
-                        user_id,
-                    ),
-                )
+                cursor.execute(_SQL_INSERT_VIDEO, _video_params(video_data, user_id))
 
-                new_id = cursor.lastrowid
-                cursor.execute("SELECT * FROM saved_videos WHERE id = ?", (new_id,))
-                row = cursor.fetchone()
+                if _SUPPORTS_RETURNING:
+                    row = cursor.fetchone()
+                else:
+                    new_id = cursor.lastrowid
+                    cursor.execute(_SQL_GET_VIDEO_BY_ROWID, (new_id,))
+                    row = cursor.fetchone()
 
                 if row:
-                    return {"success": True, "data": dict(row)}
+                    return {"success": True, "data": _unpack_transcript(_row_dict(cursor, row))}
                 else:
                     return {"success": False, "error": "Video inserted but could not retrieve"}
         except sqlite3.IntegrityError as e:
             return {"success": False, "error": f"Video already exists: {str(e)}"}
+        except PoolTimeoutError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def get_user_videos(self, user_id: int) -> list[dict[str, Any]]:
-        """Get all videos for a specific user"""
+    def save_videos(
+        self, videos: list[dict[str, Any]], user_id: int, skip_existing: bool = False
+    ) -> dict[str, Any]:
+        """Save several videos in one transaction; returns their list columns.
+
+        By default a duplicate video_id rolls back the whole batch. With
+        skip_existing=True duplicates are ignored instead, and the already
+        stored rows are returned alongside the new ones.
+        """
+        if not videos:
+            return {"success": True, "data": [], "inserted": 0}
         try:
-            with self._connect() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT * FROM saved_videos WHERE user_id = ? ORDER BY created_at DESC",
-                    (user_id,),
-                )
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                inserted = 0
+                rows: list[tuple] = []
+                # One multi-row INSERT per chunk, all inside the same transaction
+                for start in range(0, len(videos), _BULK_INSERT_CHUNK):
+                    chunk = videos[start : start + _BULK_INSERT_CHUNK]
+                    cursor.execute(
+                        _bulk_insert_sql(len(chunk), skip_existing),
+                        list(chain.from_iterable(_video_params(v, user_id) for v in chunk)),
+                    )
+                    inserted += cursor.rowcount
+                    cursor.execute(
+                        _select_videos_by_ids_sql(len(chunk)), [v["video_id"] for v in chunk]
+                    )
+                    rows.extend(cursor.fetchall())
+                return {"success": True, "data": _row_dicts(cursor, rows), "inserted": inserted}
+        except sqlite3.IntegrityError as e:
+            return {"success": False, "error": f"Video already exists: {str(e)}"}
+        except PoolTimeoutError:
+            raise
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def get_user_videos(
+        self,
+        user_id: int,
+        limit: int | None = None,
+        offset: int = 0,
+        before: tuple[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get videos for a specific user, newest first (list columns only, no transcript).
+
+        Pass before=(created_at, id) of the last row already seen to fetch the
+        next page with an index range scan instead of skipping rows by offset.
+        """
+        sql = _SQL_GET_USER_VIDEOS if before is None else _SQL_GET_USER_VIDEOS_BEFORE
+        return self._query_user_videos(sql, user_id, limit, offset, before)
+
+    def get_user_videos_full(
+        self,
+        user_id: int,
+        limit: int = FULL_VIDEO_PAGE_SIZE,
+        offset: int = 0,
+        before: tuple[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Like get_user_videos, but complete rows including raw_transcript.
+
+        Transcripts are large, so these listings are always paged.
+        """
+        sql = _SQL_GET_USER_VIDEOS_FULL if before is None else _SQL_GET_USER_VIDEOS_FULL_BEFORE
+        return self._query_user_videos(sql, user_id, limit, offset, before)
+
+    def _query_user_videos(
+        self,
+        sql: str,
+        user_id: int,
+        limit: int | None,
+        offset: int,
+        before: tuple[str, int] | None,
+    ) -> list[dict[str, Any]]:
+        row_limit = -1 if limit is None else limit
+        keyset = () if before is None else before
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(sql, (user_id, *keyset, row_limit, offset))
+                return [_unpack_transcript(v) for v in _row_dicts(cursor, cursor.fetchall())]
+        except PoolTimeoutError:
+            raise
         except Exception:
             return []
 
@@ -111,109 +466,173 @@ class DatabaseService:
         """Get video by YouTube video ID"""
         try:
             with self._connect() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM saved_videos WHERE video_id = ?", (video_id,))
+                cursor = conn.execute(_SQL_GET_VIDEO_BY_ID, (video_id,))
                 row = cursor.fetchone()
-                return dict(row) if row else None
+                return _unpack_transcript(_row_dict(cursor, row)) if row else None
+        except PoolTimeoutError:
+            raise
         except Exception:
             return None
 
-    def get_all_videos(self) -> list[dict[str, Any]]:
-        """Get all saved videos"""
+    def get_videos_by_ids(self, video_ids: list[str]) -> list[dict[str, Any]]:
+        """Get the stored videos among video_ids in one query per chunk (list columns only)"""
         try:
             with self._connect() as conn:
+                rows: list[tuple] = []
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM saved_videos ORDER BY created_at DESC")
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                for start in range(0, len(video_ids), _MAX_SQL_VARIABLES):
+                    chunk = video_ids[start : start + _MAX_SQL_VARIABLES]
+                    cursor.execute(_select_videos_by_ids_sql(len(chunk)), chunk)
+                    rows.extend(cursor.fetchall())
+                return _row_dicts(cursor, rows)
+        except PoolTimeoutError:
+            raise
+        except Exception:
+            return []
+
+    def get_all_videos(self) -> list[dict[str, Any]]:
+        """Get all saved videos (list columns only, no transcript)"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(_SQL_GET_ALL_VIDEOS)
+                return _row_dicts(cursor, cursor.fetchall())
+        except PoolTimeoutError:
+            raise
         except Exception:
             return []
 
     def create_user(self, username: str, hashed_password: str) -> dict[str, Any]:
         """Create a new user"""
         try:
-            with self._connect() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO users (username, hashed_password)
-                    VALUES (?, ?)
-                """,
-                    (username, hashed_password),
-                )
-                new_id = cursor.lastrowid
-                cursor.execute("SELECT id, username, created_at FROM users WHERE id = ?", (new_id,))
-                row = cursor.fetchone()
+                cursor.execute(_SQL_INSERT_USER, (username, hashed_password))
+                if _SUPPORTS_RETURNING:
+                    row = cursor.fetchone()
+                else:
+                    new_id = cursor.lastrowid
+                    cursor.execute(_SQL_GET_USER_BY_ID, (new_id,))
+                    row = cursor.fetchone()
                 if row:
-                    return {"success": True, "data": dict(row)}
+                    user = _row_dict(cursor, row)
+                    self.invalidate_user(user["id"])
+                    return {"success": True, "data": user}
                 else:
                     return {"success": False, "error": "User created but could not retrieve"}
         except sqlite3.IntegrityError:
             return {"success": False, "error": "Username already exists"}
+        except PoolTimeoutError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     def get_user_by_username(self, username: str) -> dict[str, Any] | None:
-        """Get user by username (includes hashed_password for auth)"""
+        """Get user by username (includes hashed_password for auth, so never cached)"""
         try:
             with self._connect() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
+                cursor = conn.execute(_SQL_GET_USER_BY_USERNAME, (username,))
                 row = cursor.fetchone()
-                return dict(row) if row else None
+                return _row_dict(cursor, row) if row else None
+        except PoolTimeoutError:
+            raise
         except Exception:
             return None
 
     def get_user_by_id(self, user_id: int) -> dict[str, Any] | None:
         """Get user by ID"""
+        with self._user_cache_lock:
+            user = self._user_by_id.get(user_id)
+        if user is not None:
+            return user
         try:
             with self._connect() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, username, created_at FROM users WHERE id = ?", (user_id,)
-                )
+                cursor = conn.execute(_SQL_GET_USER_BY_ID, (user_id,))
                 row = cursor.fetchone()
-                return dict(row) if row else None
+        except PoolTimeoutError:
+            raise
         except Exception:
             return None
+        if not row:
+            return None
+        user = _row_dict(cursor, row)
+        with self._user_cache_lock:
+            self._user_by_id[user_id] = user
+        return user
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop a cached user lookup (call after any change to a user row)."""
+        with self._user_cache_lock:
+            self._user_by_id.pop(user_id, None)
 
-    def delete_video(self, video_id: str) -> dict[str, Any]:
-        """Delete a video by ID"""
+    def delete_video(self, video_id: str, user_id: int | None = None) -> dict[str, Any]:
+        """Delete a video by ID (only if owned by user_id, when given)"""
         try:
-            with self._connect() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("DELETE FROM saved_videos WHERE video_id = ?", (video_id,))
+                if user_id is None:
+                    cursor.execute(_SQL_DELETE_VIDEO, (video_id,))
+                else:
+                    cursor.execute(_SQL_DELETE_VIDEO_OF_USER, (video_id, user_id))
                 if cursor.rowcount > 0:
                     return {"success": True}
                 else:
                     return {"success": False, "error": "Video not found"}
+        except PoolTimeoutError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def update_video(self, video_id: str, updates: dict[str, Any]) -> dict[str, Any]:
-        """Update video fields"""
+    def finish_summary(self, video_id: str, ai_summary: str | None) -> dict[str, Any]:
+        """Store a background summary (None if it failed) and clear summary_status"""
         try:
-            with self._connect() as conn:
+            with self._write_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SQL_FINISH_SUMMARY, (ai_summary, video_id))
+                if not _SUPPORTS_RETURNING:
+                    if cursor.rowcount == 0:
+                        return {"success": False, "error": "Video not found"}
+                    cursor.execute(_SQL_GET_VIDEO_BY_ID, (video_id,))
+                row = cursor.fetchone()
+                if row:
+                    return {"success": True, "data": _unpack_transcript(_row_dict(cursor, row))}
+                else:
+                    return {"success": False, "error": "Video not found"}
+        except PoolTimeoutError:
+            raise
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def update_video(
+        self, video_id: str, updates: dict[str, Any], user_id: int | None = None
+    ) -> dict[str, Any]:
+        """Update video fields (only if owned by user_id, when given)"""
+        # Only allow updating certain fields
+        if not any(field in updates for field in _UPDATABLE_VIDEO_FIELDS):
+            return {"success": False, "error": "No valid fields to update"}
+        values: list[Any] = []
+        for field in _UPDATABLE_VIDEO_FIELDS:
+            values += (field in updates, updates.get(field))
+        values.append(video_id)
+        if user_id is None:
+            sql = _SQL_UPDATE_VIDEO
+        else:
+            sql = _SQL_UPDATE_VIDEO_OF_USER
+            values.append(user_id)
+        try:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
-                # Only allow updating certain fields
-                allowed_fields = ["ai_summary", "title"]
-                update_parts = []
-                values = []
-                for field in allowed_fields:
-                    if field in updates:
-                        update_parts.append(f"{field} = ?")
-                        values.append(updates[field])
-                if not update_parts:
-                    return {"success": False, "error": "No valid fields to update"}
-                values.append(video_id)
-                query = f"UPDATE saved_videos SET {', '.join(update_parts)} WHERE video_id = ?"
-                cursor.execute(query, values)
-                # Get updated video
-                cursor.execute("SELECT * FROM saved_videos WHERE video_id = ?", (video_id,))
+                cursor.execute(sql, values)
+                if not _SUPPORTS_RETURNING:
+                    if cursor.rowcount == 0:
+                        return {"success": False, "error": "Video not found"}
+                    # Get updated video
+                    cursor.execute(_SQL_GET_VIDEO_BY_ID, (video_id,))
                 row = cursor.fetchone()
                 if row:
-                    return {"success": True, "data": dict(row)}
+                    return {"success": True, "data": _unpack_transcript(_row_dict(cursor, row))}
                 else:
                     return {"success": False, "error": "Video not found"}
+        except PoolTimeoutError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -1,29 +1,118 @@
+import asyncio
+import hashlib
 import os
+import re
+import threading
+from collections.abc import Iterator
+from itertools import islice
 
-from groq import Groq
+from cachetools import LRUCache
+from groq import AsyncGroq, Groq
 
 # Defaults are centralized for easier tuning/testing
 DEFAULT_MODEL = "llama-3.3-70b-versatile"
 DEFAULT_TEMPERATURE = 0.4
 DEFAULT_MAX_OUTPUT_TOKENS = 1000
+# Prompt budget in approximate tokens; English transcripts still hit max_length first
+DEFAULT_MAX_INPUT_TOKENS = 3000
+# Summaries of identical inputs are reused instead of paying for another LLM call
+SUMMARY_CACHE_SIZE = 256
+# In-flight requests per summarize_many call, to stay within Groq rate limits
+DEFAULT_SUMMARY_CONCURRENCY = 8
+
+# The system prompt is identical for every request; build the message once and
+# never mutate it
+_SYSTEM_PROMPT = (
+    "You are an assistant that summarizes YouTube transcripts into concise, "
+    "structured notes. Adapt your style depending on the type of video:\n\n"
+    "- If it's a recipe → list ingredients and step-by-step instructions.\n"
+    "- If it's a travel/destination video → create an itinerary with places, activities, and tips.\n"
+    "- If it's an educational/talk/tutorial → list key points, definitions, and takeaways.\n\n"
+    "Keep notes clear, skimmable, and avoid filler words. Use Markdown with emojis if useful."
+    "Keep notes concise, aim for 400-500 words"
+)
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Cheap stand-in for the model's BPE tokenizer: a common English word (up to six
+# letters) or a run of up to three digits is one token, and every other visible
+# character (punctuation, non-Latin scripts) counts as one token
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]{1,6}|\d{1,3}|\S")
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text after roughly max_tokens tokens (see _TOKEN_PATTERN)."""
+    # Every token spans at least one character, so short text is always in budget
+    if len(text) <= max_tokens:
+        return text
+    last = next(islice(_TOKEN_PATTERN.finditer(text), max_tokens - 1, None), None)
+    return text if last is None else text[: last.end()]
 
 
 class GroqSummarizer:
     """Service to adaptively summarize video transcripts using Groq AI"""
 
-    def __init__(self):
+    def __init__(self, model: str = DEFAULT_MODEL, temperature: float = DEFAULT_TEMPERATURE):
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             raise ValueError("GROQ_API_KEY not found in environment variables")
         self.client = Groq(api_key=api_key)
+        self._api_key = api_key
+        self._aclient: AsyncGroq | None = None
+        self.model = model
+        self.temperature = temperature
+        self._summary_cache: LRUCache = LRUCache(maxsize=SUMMARY_CACHE_SIZE)
+        self._summary_cache_lock = threading.Lock()
+
+    @property
+    def aclient(self) -> AsyncGroq:
+        """Async client, created on first use so sync-only callers never build it."""
+        if self._aclient is None:
+            self._aclient = AsyncGroq(api_key=self._api_key)
+        return self._aclient
 
-    def summarize(self, transcript: str, max_length: int = 12000) -> dict:
+    def _cache_key(self, truncated_transcript: str) -> bytes:
+        """Key a summary by everything that determines the model's output."""
+        material = f"{self.model}\x00{self.temperature}\x00{truncated_transcript}"
+        return hashlib.sha256(material.encode()).digest()
+
+    def _cached_summary(self, key: bytes) -> str | None:
+        with self._summary_cache_lock:
+            return self._summary_cache.get(key)
+
+    def _store_summary(self, key: bytes, summary: str | None) -> None:
+        if summary:
+            with self._summary_cache_lock:
+                self._summary_cache[key] = summary
+
+    def _completion_kwargs(self, truncated_transcript: str) -> dict:
+        """Build the chat completion request shared by the sync and async paths."""
+        return {
+            "model": self.model,
+            "messages": [
+                _SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": f"Here is the transcript:\n\n{truncated_transcript}\n\nPlease create adaptive notes.",
+                },
+            ],
+            "temperature": self.temperature,  # more deterministic
+            "max_tokens": DEFAULT_MAX_OUTPUT_TOKENS,  # longer output allowed
+        }
+
+    def summarize(
+        self,
+        transcript: str,
+        max_length: int = 12000,
+        max_input_tokens: int = DEFAULT_MAX_INPUT_TOKENS,
+    ) -> dict:
         """
         Generate adaptive notes from a video transcript.
 
         Args:
             transcript: The full transcript text
             max_length: Maximum characters to send to API (to avoid token limits)
+            max_input_tokens: Approximate token budget for the transcript, so
+                non-English text isn't billed far beyond the English equivalent
 
         Returns:
             dict with 'success' and 'summary' or 'error'
@@ -31,35 +120,110 @@ class GroqSummarizer:
         try:
             if not transcript or not transcript.strip():
                 return {"success": False, "error": "Transcript is empty"}
-            truncated_transcript = transcript[:max_length]
+            truncated_transcript = truncate_to_tokens(transcript[:max_length], max_input_tokens)
+
+            key = self._cache_key(truncated_transcript)
+            cached = self._cached_summary(key)
+            if cached is not None:
+                return {"success": True, "summary": cached}
 
             response = self.client.chat.completions.create(
-                model=DEFAULT_MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an assistant that summarizes YouTube transcripts into concise, "
-                            "structured notes. Adapt your style depending on the type of video:\n\n"
-                            "- If it's a recipe → list ingredients and step-by-step instructions.\n"
-                            "- If it's a travel/destination video → create an itinerary with places, activities, and tips.\n"
-                            "- If it's an educational/talk/tutorial → list key points, definitions, and takeaways.\n\n"
-                            "Keep notes clear, skimmable, and avoid filler words. Use Markdown with emojis if useful."
-                            "Keep notes concise, aim for 400-500 words"
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Here is the transcript:\n\n{truncated_transcript}\n\nPlease create adaptive notes.",
-                    },
-                ],
-                temperature=DEFAULT_TEMPERATURE,  # more deterministic
-                max_tokens=DEFAULT_MAX_OUTPUT_TOKENS,  # longer output allowed
+                **self._completion_kwargs(truncated_transcript)
+            )
+
+            summary = response.choices[0].message.content
+            self._store_summary(key, summary)
+
+            return {"success": True, "summary": summary}
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def summarize_stream(
+        self,
+        transcript: str,
+        max_length: int = 12000,
+        max_input_tokens: int = DEFAULT_MAX_INPUT_TOKENS,
+    ) -> Iterator[str]:
+        """
+        Generate adaptive notes, yielding text chunks as Groq produces them.
+
+        Takes the same arguments as `summarize`. The complete summary is cached
+        once the stream finishes, so a later `summarize` call reuses it.
+
+        Raises:
+            ValueError: If the transcript is empty
+            Exception: Groq API errors are raised, not returned as a dict
+        """
+        if not transcript or not transcript.strip():
+            raise ValueError("Transcript is empty")
+        truncated_transcript = truncate_to_tokens(transcript[:max_length], max_input_tokens)
+
+        key = self._cache_key(truncated_transcript)
+        cached = self._cached_summary(key)
+        if cached is not None:
+            yield cached
+            return
+
+        stream = self.client.chat.completions.create(
+            **self._completion_kwargs(truncated_transcript), stream=True
+        )
+        parts: list[str] = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content
+            if text:
+                parts.append(text)
+                yield text
+        self._store_summary(key, "".join(parts))
+
+    async def summarize_async(
+        self,
+        transcript: str,
+        max_length: int = 12000,
+        max_input_tokens: int = DEFAULT_MAX_INPUT_TOKENS,
+    ) -> dict:
+        """Async variant of `summarize` using Groq's async client (same arguments and result)."""
+        try:
+            if not transcript or not transcript.strip():
+                return {"success": False, "error": "Transcript is empty"}
+            truncated_transcript = truncate_to_tokens(transcript[:max_length], max_input_tokens)
+
+            key = self._cache_key(truncated_transcript)
+            cached = self._cached_summary(key)
+            if cached is not None:
+                return {"success": True, "summary": cached}
+
+            response = await self.aclient.chat.completions.create(
+                **self._completion_kwargs(truncated_transcript)
             )
 
             summary = response.choices[0].message.content
+            self._store_summary(key, summary)
 
             return {"success": True, "summary": summary}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
+
+    async def summarize_many(
+        self, transcripts: list[str], concurrency: int = DEFAULT_SUMMARY_CONCURRENCY
+    ) -> list[dict]:
+        """
+        Summarize several transcripts concurrently.
+
+        Args:
+            transcripts: Transcript texts to summarize
+            concurrency: Maximum requests in flight at once
+
+        Returns:
+            One `summarize`-style result dict per transcript, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def summarize_one(transcript: str) -> dict:
+            async with semaphore:
+                return await self.summarize_async(transcript)
+
+        return await asyncio.gather(*(summarize_one(t) for t in transcripts))
@@ -3,8 +3,11 @@
 Separates auth business logic from HTTP handling.
 """
 
+import threading
 from datetime import timedelta
 
+from cachetools import TTLCache
+
 from backend.protocols import UserRepository
 from backend.services.auth_service import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -13,6 +16,12 @@ from backend.services.auth_service import (
     verify_password,
 )
 
+# Usernames recently found not to exist; repeated logins for them (scanners,
+# typos) are rejected without a database lookup. Kept short so a signup in
+# another worker process becomes visible almost immediately.
+UNKNOWN_USER_CACHE_SIZE = 4096
+UNKNOWN_USER_TTL_SECONDS = 1
+
 
 class AuthService:
     """Service for handling authentication-related business logic."""
@@ -25,6 +34,10 @@ class AuthService:
             user_repository: User data storage (e.g., DatabaseService)
         """
         self.user_repository = user_repository
+        self._unknown_usernames: TTLCache = TTLCache(
+            maxsize=UNKNOWN_USER_CACHE_SIZE, ttl=UNKNOWN_USER_TTL_SECONDS
+        )
+        self._unknown_usernames_lock = threading.Lock()
 
     def signup(self, username: str, password: str) -> dict:
         """
@@ -52,6 +65,9 @@ class AuthService:
         if not result["success"]:
             return result
 
+        with self._unknown_usernames_lock:
+            self._unknown_usernames.pop(username, None)
+
         user = result["data"]
 
         # Generate JWT token
@@ -79,10 +95,16 @@ class AuthService:
             dict with success, access_token, token_type, and username
             or success=False with error
         """
+        with self._unknown_usernames_lock:
+            if username in self._unknown_usernames:
+                return {"success": False, "error": "Invalid username or password"}
+
         # Get user from repository
         user = self.user_repository.get_user_by_username(username)
 
         if not user:
+            with self._unknown_usernames_lock:
+                self._unknown_usernames[username] = True
             return {"success": False, "error": "Invalid username or password"}
 
         # Verify password
@@ -3,8 +3,36 @@
 Separates business logic from HTTP handling, following Single Responsibility Principle.
 """
 
+import base64
+import binascii
+import logging
+
 from backend.protocols import Summarizer, VideoFetcher, VideoRepository
 
+logger = logging.getLogger(__name__)
+
+# Page size for listings with transcripts when the caller doesn't set a limit
+TRANSCRIPT_PAGE_SIZE = 50
+
+# Stored in the video row while its AI summary is deferred to `summarize_video`;
+# kept in the database rather than in memory so every worker process sees it
+SUMMARY_PENDING = "pending"
+
+
+def encode_page_cursor(video: dict) -> str:
+    """Build an opaque keyset cursor pointing just after a listed video."""
+    raw = f"{video['id']}:{video['created_at']}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_page_cursor(cursor: str) -> tuple[str, int]:
+    """Turn a cursor from `encode_page_cursor` back into (created_at, id)."""
+    try:
+        video_id, _, created_at = base64.urlsafe_b64decode(cursor).decode().partition(":")
+        return created_at, int(video_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid page cursor") from None
+
 
 class VideoService:
     """Service for handling video-related business logic."""
@@ -27,17 +55,43 @@ class VideoService:
         self.repository = repository
         self.summarizer = summarizer
 
-    def save_video(self, url: str, user_id: int) -> dict:
+    @property
+    def summarizer_available(self) -> bool:
+        """Check if an AI summarizer is configured."""
+        return self.summarizer is not None
+
+    def save_video(self, url: str, user_id: int, summarize: bool = True) -> dict:
         """
         Save a video transcript with optional AI summary.
 
         Args:
             url: Video URL
             user_id: ID of the user saving the video
+            summarize: Generate the summary inline; pass False to defer it
+                to `summarize_video` (e.g. from a background task)
 
         Returns:
             dict with success status and data/error
         """
+        prepared = self.prepare_video(url, summarize=summarize)
+        if "video_data" not in prepared:
+            return prepared
+
+        # Save to repository
+        return self.repository.save_video(prepared["video_data"], user_id)
+
+    def prepare_video(self, url: str, summarize: bool = True) -> dict:
+        """
+        Fetch everything needed to save a video, without writing it.
+
+        Args:
+            url: Video URL
+            summarize: Generate the AI summary inline
+
+        Returns:
+            dict with success=True and video_data ready for the repository,
+            the existing row (with a message) if already saved, or an error
+        """
         # Extract video ID and check if already exists
         video_id = self.fetcher.extract_video_id(url)
         existing = self.repository.get_video_by_id(video_id)
@@ -46,8 +100,69 @@ class VideoService:
             return {"success": True, "message": "Video already exists", "data": existing}
 
         # Fetch transcript
-        transcript_result = self.fetcher.get_transcript(url)
+        transcript_result = self.fetcher.get_transcript(url, video_id=video_id)
+        return self._build_video_data(url, transcript_result, summarize)
+
+    def prepare_videos(self, urls: list[str], summarize: bool = False) -> list[dict]:
+        """
+        Batch counterpart of `prepare_video`.
+
+        Already saved videos are found with one repository lookup and the
+        remaining transcripts are fetched concurrently.
 
+        Args:
+            urls: Video URLs
+            summarize: Generate AI summaries inline (one at a time)
+
+        Returns:
+            One `prepare_video`-style result per URL, in input order; URLs for
+            the same video share a result
+        """
+        video_ids: list[str | None] = []
+        url_errors: dict[str, dict] = {}
+        for url in urls:
+            try:
+                video_ids.append(self.fetcher.extract_video_id(url))
+            except Exception as e:
+                video_ids.append(None)
+                url_errors[url] = {"success": False, "error": str(e) or type(e).__name__}
+
+        existing = {
+            video["video_id"]: video
+            for video in self.repository.get_videos_by_ids(
+                list({video_id for video_id in video_ids if video_id})
+            )
+        }
+
+        # Fetch each missing video once, via the first URL that names it
+        to_fetch = {}
+        for url, video_id in zip(urls, video_ids, strict=True):
+            if video_id and video_id not in existing:
+                to_fetch.setdefault(video_id, url)
+        transcripts = self.fetcher.get_transcripts(
+            list(to_fetch.values()), video_ids=list(to_fetch)
+        )
+        by_video_id = {
+            video_id: self._build_video_data(url, transcript_result, summarize)
+            for (video_id, url), transcript_result in zip(
+                to_fetch.items(), transcripts, strict=True
+            )
+        }
+
+        results = []
+        for url, video_id in zip(urls, video_ids, strict=True):
+            if video_id is None:
+                results.append(url_errors[url])
+            elif video_id in existing:
+                results.append(
+                    {"success": True, "message": "Video already exists", "data": existing[video_id]}
+                )
+            else:
+                results.append(by_video_id[video_id])
+        return results
+
+    def _build_video_data(self, url: str, transcript_result: dict, summarize: bool) -> dict:
+        """Turn a fetcher result into a `prepare_video` result (with optional summary)."""
         if not transcript_result["success"]:
             return {
                 "success": False,
@@ -55,34 +170,122 @@ class VideoService:
                 "error_type": transcript_result.get("error_type"),
             }
 
+        transcript = transcript_result["transcript"]
+        video_id = transcript_result["video_id"]
+
         # Generate AI summary if summarizer available
         ai_summary = None
-        if self.summarizer:
-            summary_result = self.summarizer.summarize(transcript_result["transcript"])
+        if summarize and self.summarizer:
+            summary_result = self.summarizer.summarize(transcript)
             if summary_result["success"]:
                 ai_summary = summary_result["summary"]
             else:
                 # Log but don't fail - summary is optional
-                print(f"Warning: Failed to generate summary - {summary_result.get('error')}")
+                logger.warning(
+                    "Failed to generate summary for video %s: %s",
+                    video_id,
+                    summary_result.get("error"),
+                )
 
         # Prepare video data
         video_data = {
             "url": url,
-            "video_id": transcript_result["video_id"],
-            "raw_transcript": transcript_result["transcript"],
+            "video_id": video_id,
+            "raw_transcript": transcript,
             "ai_summary": ai_summary,
             "language": transcript_result.get("language"),
             "is_generated": transcript_result.get("is_generated"),
             "segments_count": transcript_result["segments_count"],
             "platform": "youtube",
+            # A deferred summary is pending from the moment the row exists
+            "summary_status": SUMMARY_PENDING if not summarize and self.summarizer else None,
         }
 
-        # Save to repository
-        return self.repository.save_video(video_data, user_id)
+        return {"success": True, "video_data": video_data}
+
+    def save_videos(self, videos: list[dict], user_id: int, skip_existing: bool = False) -> dict:
+        """
+        Bulk-save prepared videos (see `prepare_video`) in one repository call.
+
+        Args:
+            videos: video_data dicts from `prepare_video`
+            user_id: ID of the user saving the videos
+            skip_existing: Ignore videos that are already stored instead of
+                rolling back the whole batch
 
-    def get_user_videos(self, user_id: int) -> list[dict]:
-        """Get all videos for a specific user."""
-        return self.repository.get_user_videos(user_id)
+        Returns:
+            dict with success status and the saved rows or error
+        """
+        return self.repository.save_videos(videos, user_id, skip_existing=skip_existing)
+
+    def summarize_video(self, video_id: str) -> dict:
+        """
+        Generate and store the AI summary for an already saved video.
+
+        Ends the video's pending summary status whether or not this succeeds.
+
+        Args:
+            video_id: Video ID to summarize
+
+        Returns:
+            dict with success status and updated data or error
+        """
+        if not self.summarizer:
+            return {"success": False, "error": "Summarizer not available"}
+
+        video = self.repository.get_video_by_id(video_id)
+        if not video:
+            return {"success": False, "error": "Video not found"}
+
+        summary = None
+        try:
+            summary_result = self.summarizer.summarize(video["raw_transcript"])
+            if summary_result["success"]:
+                summary = summary_result["summary"]
+            else:
+                logger.warning(
+                    "Failed to generate summary for video %s: %s",
+                    video_id,
+                    summary_result.get("error"),
+                )
+        finally:
+            # Polling clients stop waiting once the status is cleared
+            result = self.repository.finish_summary(video_id, summary)
+
+        if summary is None:
+            return {"success": False, "error": summary_result.get("error")}
+        return result
+
+    def get_user_videos(
+        self,
+        user_id: int,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: str | None = None,
+        with_transcripts: bool = False,
+    ) -> list[dict]:
+        """
+        Get videos for a specific user, newest first (all of them unless limit is set).
+
+        Args:
+            user_id: ID of the user
+            limit: Maximum number of videos to return
+            offset: Number of videos to skip
+            cursor: Continue after the video this cursor was made from
+                (see `encode_page_cursor`); raises ValueError if malformed
+            with_transcripts: Return full videos (raw_transcript included) so
+                detail views need no further lookups; limit defaults to
+                TRANSCRIPT_PAGE_SIZE
+        """
+        before = decode_page_cursor(cursor) if cursor else None
+        if with_transcripts:
+            return self.repository.get_user_videos_full(
+                user_id,
+                limit=TRANSCRIPT_PAGE_SIZE if limit is None else limit,
+                offset=offset,
+                before=before,
+            )
+        return self.repository.get_user_videos(user_id, limit=limit, offset=offset, before=before)
 
     def get_video(self, video_id: str, user_id: int) -> dict | None:
         """
@@ -100,6 +303,30 @@ class VideoService:
             return video
         return None
 
+    def get_video_status(self, video_id: str, user_id: int) -> dict | None:
+        """
+        Report processing status of a user's video for polling clients.
+
+        Args:
+            video_id: Video ID to check
+            user_id: ID of requesting user
+
+        Returns:
+            dict with video_id and summary_status ("ready", "pending" or
+            "unavailable"), or None if not found or not owned by the user
+        """
+        video = self.get_video(video_id, user_id)
+        if not video:
+            return None
+
+        if video.get("ai_summary"):
+            summary_status = "ready"
+        elif video.get("summary_status") == SUMMARY_PENDING:
+            summary_status = "pending"
+        else:
+            summary_status = "unavailable"
+        return {"video_id": video_id, "summary_status": summary_status}
+
     def delete_video(self, video_id: str, user_id: int) -> dict:
         """
         Delete video, ensuring it belongs to the user.
@@ -111,14 +338,12 @@ class VideoService:
         Returns:
             dict with success status and error if applicable
         """
-        video = self.repository.get_video_by_id(video_id)
-        if not video:
-            return {"success": False, "error": "Video not found"}
-
-        if video.get("user_id") != user_id:
-            return {"success": False, "error": "Access denied"}
-
-        return self.repository.delete_video(video_id)
+        # Ownership is checked by the delete itself; look the video up only to
+        # tell "not found" from "not yours" when nothing was deleted
+        result = self.repository.delete_video(video_id, user_id=user_id)
+        if result["success"] or result.get("error") != "Video not found":
+            return result
+        return self._missing_or_denied(video_id, user_id) or result
 
     def update_video(self, video_id: str, user_id: int, updates: dict) -> dict:
         """
@@ -132,11 +357,21 @@ class VideoService:
         Returns:
             dict with success status and updated data or error
         """
+        result = self.repository.update_video(video_id, updates, user_id=user_id)
+        # Invalid updates are rejected before the statement runs, so ownership
+        # still has to be checked to report other users' videos as 404/403
+        if result["success"] or result.get("error") not in (
+            "Video not found",
+            "No valid fields to update",
+        ):
+            return result
+        return self._missing_or_denied(video_id, user_id) or result
+
+    def _missing_or_denied(self, video_id: str, user_id: int) -> dict | None:
+        """Explain why an owner-scoped write didn't apply (None if the user owns the video)."""
         video = self.repository.get_video_by_id(video_id)
         if not video:
             return {"success": False, "error": "Video not found"}
-
         if video.get("user_id") != user_id:
             return {"success": False, "error": "Access denied"}
-
-        return self.repository.update_video(video_id, updates)
+        return None
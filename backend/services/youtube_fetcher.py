@@ -1,10 +1,75 @@
 # Used: https://pypi.org/project/youtube-transcript-api/
+import asyncio
+import contextlib
+import random
+import re
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from xml.etree.ElementTree import ParseError
 
-from youtube_transcript_api import YouTubeTranscriptApi
+import orjson
+from youtube_transcript_api import YouTubeRequestFailed, YouTubeTranscriptApi
 
-from backend.protocols import TranscriptClient
+from backend.protocols import Cache, TranscriptClient
+from backend.services.cache import MemoryCache
+
+# Transcript downloads in flight per process. The client is blocking, so all
+# fetches (batches and async callers) share one bounded pool instead of
+# spawning threads per call; keep it within the HTTP connection pool (10).
+FETCH_CONCURRENCY = 8
+_fetch_executor = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY, thread_name_prefix="yt-fetch")
+
+# Transcripts effectively never change, so successful fetches are cached. Entries
+# are zlib-compressed JSON: transcripts are repetitive text (~3x smaller), and
+# bytes values work unchanged with an external cache behind the Cache protocol.
+TRANSCRIPT_CACHE_SIZE = 256
+TRANSCRIPT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Outbound fetches are throttled per fetcher (token bucket) to stay under
+# YouTube's implicit rate limit, and transient failures are retried with
+# jittered exponential backoff. Permanent errors (TranscriptsDisabled,
+# NoTranscriptFound, RequestBlocked, ...) fail fast.
+FETCH_RATE_PER_SECOND = 5.0
+FETCH_MAX_ATTEMPTS = 3
+FETCH_BACKOFF_INITIAL_SECONDS = 0.5
+FETCH_BACKOFF_MAX_SECONDS = 8.0
+# Network errors (requests' exceptions are OSErrors), HTTP failures, truncated XML
+_TRANSIENT_FETCH_ERRORS = (YouTubeRequestFailed, OSError, ParseError)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket; `acquire` blocks until a token is available."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Delay before retry number attempt + 1: exponential, capped, with jitter."""
+    delay = min(FETCH_BACKOFF_MAX_SECONDS, FETCH_BACKOFF_INITIAL_SECONDS * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
 
 
 class _YouTubeTranscriptClientAdapter:
@@ -16,14 +81,33 @@ class _YouTubeTranscriptClientAdapter:
 
     def __init__(self) -> None:
         self.api = YouTubeTranscriptApi()
+        # Pick the entry point once: newer versions expose instance `.fetch`
+        # returning a FetchedTranscript, older ones the classic static
+        # `get_transcript` returning list[dict]
+        self._fetch = getattr(self.api, "fetch", None) or YouTubeTranscriptApi.get_transcript
 
     def fetch(self, video_id: str, languages: list[str]) -> object:
-        try:
-            # Newer versions expose instance `.fetch` returning a FetchedTranscript
-            return self.api.fetch(video_id, languages=languages)  # type: ignore[attr-defined]
-        except AttributeError:
-            # Fallback to classic static method that returns list[dict]
-            return YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
+        return self._fetch(video_id, languages=languages)
+
+
+# One pass over the URL: short links, watch URLs (v= as a real query parameter,
+# so e.g. "dev=" doesn't match), Shorts, embeds and live streams
+_VIDEO_ID_RE = re.compile(r"(?:youtu\.be/|[?&]v=|/shorts/|/embed/|/live/)([A-Za-z0-9_-]+)")
+
+# Anchored on the host (scheme optional, any subdomain such as www./m./music.),
+# so e.g. "https://example.com/?ref=youtube.com" is not accepted
+_YOUTUBE_HOST_RE = re.compile(
+    r"\s*(?:https?://)?(?:[a-z0-9-]+\.)*(?:youtube\.com|youtu\.be)(?:[/:?#]|$)", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_video_id(url: str) -> str:
+    """Parse a video ID out of a URL (pure function, so results are cached)."""
+    match = _VIDEO_ID_RE.search(url)
+    if match is None:
+        raise ValueError("Please use a standard YouTube URL")
+    return match.group(1)
 
 
 class YouTubeFetcher:
@@ -36,46 +120,72 @@ class YouTubeFetcher:
       and the classic list-of-dicts format returned by `get_transcript`.
     """
 
-    def __init__(self, client: TranscriptClient | None = None) -> None:
+    def __init__(self, client: TranscriptClient | None = None, cache: Cache | None = None) -> None:
         # Dependency inversion: allow injecting a transcript client.
         # Default keeps backward compatibility for tests/consumers.
         self._client: TranscriptClient = client or _YouTubeTranscriptClientAdapter()
+        self._cache: Cache = (
+            cache
+            if cache is not None
+            else MemoryCache(
+                maxsize=TRANSCRIPT_CACHE_SIZE, default_ttl=TRANSCRIPT_CACHE_TTL_SECONDS
+            )
+        )
+        self._rate_limiter = _TokenBucket(FETCH_RATE_PER_SECOND)
+        # Per-video locks so concurrent requests for one video fetch it once
+        self._inflight: dict[str, list] = {}
+        self._inflight_lock = threading.Lock()
 
-    def extract_video_id(self, url: str) -> str:
-        """Extract the YouTube video ID from a URL.
-
-        Supports standard watch URLs and youtu.be short links. Keeps behavior
-        consistent with tests, but uses urllib for slightly safer parsing.
-        """
-        raw = url.strip()
+    @contextmanager
+    def _single_flight(self, video_id: str) -> Iterator[None]:
+        """Serialize fetches of the same video; other videos proceed in parallel."""
+        with self._inflight_lock:
+            entry = self._inflight.setdefault(video_id, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._inflight_lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._inflight[video_id]
 
-        # Try short form first: https://youtu.be/<id>?...
-        if "youtu.be/" in raw:
+    def _fetch_payload(self, video_id: str) -> object:
+        """Fetch through the rate limiter, retrying transient failures."""
+        attempt = 0
+        while True:
+            self._rate_limiter.acquire()
             try:
-                path_id = urlparse(raw).path.lstrip("/")
-                if path_id:
-                    return path_id.split("/")[0]
-            except Exception:
-                pass
+                # Prefer English variants via injected client
+                return self._client.fetch(video_id, languages=["en", "en-US", "en-GB"])
+            except _TRANSIENT_FETCH_ERRORS:
+                if attempt + 1 >= FETCH_MAX_ATTEMPTS:
+                    raise
+                time.sleep(_backoff_delay(attempt))
+                attempt += 1
 
-            # Fallback string split (back-compatible with prior logic)
-            return raw.split("youtu.be/")[1].split("?")[0]
+    def _cached_transcript(self, key: str) -> dict | None:
+        """Return a cached result; cache problems count as a miss, never an error."""
+        try:
+            blob = self._cache.get(key)
+            return None if blob is None else orjson.loads(zlib.decompress(blob))
+        except Exception:
+            return None
 
-        # Standard form: https://www.youtube.com/watch?v=<id>&...
-        if "v=" in raw:
-            try:
-                parsed = urlparse(raw)
-                qs = parse_qs(parsed.query)
-                v = qs.get("v", [None])[0]
-                if v:
-                    return v
-            except Exception:
-                pass
+    def _store_transcript(self, key: str, result: dict) -> None:
+        # Caching is best effort
+        with contextlib.suppress(Exception):
+            self._cache.set(key, zlib.compress(orjson.dumps(result)))
 
-            # Fallback string split (back-compatible with prior logic)
-            return raw.split("v=")[1].split("&")[0]
+    def extract_video_id(self, url: str) -> str:
+        """Extract the YouTube video ID from a URL.
 
-        raise ValueError("Please use a standard YouTube URL")
+        Supports standard watch URLs, youtu.be short links, Shorts, embed and
+        live URLs, using a single precompiled regex. Results are memoized per
+        URL (see `_extract_video_id`).
+        """
+        return _extract_video_id(url)
 
     def _join_text_from_payload(self, payload: Any) -> dict[str, Any]:
         """Normalize various transcript payload shapes into a common dict.
@@ -93,9 +203,8 @@ class YouTubeFetcher:
         # FetchedTranscript object with `.snippets`
         snippets = getattr(payload, "snippets", None)
         if isinstance(snippets, list):
-            texts = [getattr(s, "text", "") for s in snippets]
             return {
-                "transcript": " ".join(t for t in texts if t),
+                "transcript": " ".join([t for s in snippets if (t := getattr(s, "text", ""))]),
                 "segments_count": len(snippets),
                 "language": language,
                 "is_generated": is_generated,
@@ -103,9 +212,8 @@ class YouTubeFetcher:
 
         # List of dicts (classic youtube-transcript-api)
         if isinstance(payload, list) and payload and isinstance(payload[0], dict):
-            texts = [str(item.get("text", "")) for item in payload]
             return {
-                "transcript": " ".join(t for t in texts if t),
+                "transcript": " ".join([t for item in payload if (t := str(item.get("text", "")))]),
                 "segments_count": len(payload),
                 "language": language,
                 "is_generated": is_generated,
@@ -128,9 +236,12 @@ class YouTubeFetcher:
             "is_generated": is_generated,
         }
 
-    def get_transcript(self, url: str) -> dict:
+    def get_transcript(self, url: str, video_id: str | None = None) -> dict:
         """Fetch transcript for the given URL, preferring English variants.
 
+        Pass video_id when it is already known (e.g. from `extract_video_id`)
+        so the URL isn't parsed twice.
+
         Returns a dict:
         - success: bool
         - video_id: str | None
@@ -140,23 +251,35 @@ class YouTubeFetcher:
         - is_generated: Optional[bool]
         - error, error_type (on failure)
         """
-        video_id: str | None = None
         try:
-            video_id = self.extract_video_id(url)
+            video_id = video_id or self.extract_video_id(url)
+            key = f"yt:tx:{video_id}"
 
-            # Prefer English variants via injected client
-            payload = self._client.fetch(video_id, languages=["en", "en-US", "en-GB"])
+            cached = self._cached_transcript(key)
+            if cached is not None:
+                return cached
 
-            normalized = self._join_text_from_payload(payload)
+            with self._single_flight(video_id):
+                # Another request may have fetched it while we waited
+                cached = self._cached_transcript(key)
+                if cached is not None:
+                    return cached
 
-            return {
-                "success": True,
-                "video_id": video_id,
-                "transcript": normalized["transcript"],
-                "segments_count": normalized["segments_count"],
-                "language": normalized.get("language"),
-                "is_generated": normalized.get("is_generated"),
-            }
+                payload = self._fetch_payload(video_id)
+
+                normalized = self._join_text_from_payload(payload)
+
+                result = {
+                    "success": True,
+                    "video_id": video_id,
+                    "transcript": normalized["transcript"],
+                    "segments_count": normalized["segments_count"],
+                    "language": normalized.get("language"),
+                    "is_generated": normalized.get("is_generated"),
+                }
+                # Only successes are cached; failures may be transient
+                self._store_transcript(key, result)
+                return result
 
         except Exception as e:
             return {
@@ -166,5 +289,27 @@ class YouTubeFetcher:
                 "video_id": video_id,
             }
 
+    async def get_transcript_async(self, url: str) -> dict:
+        """Awaitable `get_transcript`; the blocking fetch runs on the fetch pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_fetch_executor, self.get_transcript, url)
+
+    def get_transcripts(self, urls: list[str], video_ids: list[str] | None = None) -> list[dict]:
+        """Fetch transcripts for several URLs concurrently.
+
+        Downloads are network-bound and the transcript client is blocking, so
+        they fan out over the shared fetch pool. Pass video_ids (parallel to
+        urls) when already extracted, as for `get_transcript`. Returns one
+        `get_transcript` result per URL, in input order (failures are results,
+        not raised).
+        """
+        ids = video_ids if video_ids is not None else [None] * len(urls)
+        if len(urls) <= 1:
+            return [
+                self.get_transcript(url, video_id) for url, video_id in zip(urls, ids, strict=True)
+            ]
+        return list(_fetch_executor.map(self.get_transcript, urls, ids))
+
     def can_handle(self, url: str) -> bool:
-        return "youtube.com" in url.lower() or "youtu.be" in url.lower()
+        """Check the URL's host is YouTube (a mention elsewhere in the URL doesn't count)."""
+        return _YOUTUBE_HOST_RE.match(url) is not None
@@ -0,0 +1,16 @@
+"""Gunicorn settings for running the FastAPI app under Uvicorn workers.
+
+Usage: gunicorn -c gunicorn_conf.py backend.main:app
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", str(2 * multiprocessing.cpu_count() + 1)))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Saving a video fetches a transcript and may call Groq, which can take a while
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
@@ -1,5 +1,6 @@
 import os
 import sqlite3
+from unittest.mock import patch
 
 import pytest
 
@@ -57,8 +58,6 @@ def setup_test_db():
     # Replace global container with test container
     from backend import dependencies
 
-    original_container = dependencies._container
-
     # Create test container
     test_container = ServiceContainer.__new__(ServiceContainer)
     test_container._db_service = test_db_service
@@ -92,17 +91,23 @@ def setup_test_db():
 
     test_container._metrics_service = MetricsService()
 
-    # Replace global container
-    dependencies._container = test_container
+    # Replace global container (get_container is lru-cached, so prime the cache)
+    dependencies.reset_container()
+    with patch.object(dependencies, "ServiceContainer", return_value=test_container):
+        dependencies.get_container()
 
     yield test_db_service
 
-    # Restore original container
-    dependencies._container = original_container
+    # Drop the test container; the next access builds a real one
+    dependencies.reset_container()
+
+    # Release pooled connections before removing the file
+    test_db_service.close()
 
-    # Cleanup after all tests
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
+    # Cleanup after all tests (including WAL side files)
+    for path in (test_db_path, f"{test_db_path}-wal", f"{test_db_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 @pytest.fixture
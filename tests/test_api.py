@@ -51,6 +51,16 @@ def test_health_check():
     assert response.json()["status"] == "healthy"
 
 
+def test_shutdown_drops_the_service_container():
+    """Test a closed container isn't reused by the next app startup"""
+    from backend import dependencies
+
+    with TestClient(app):
+        assert dependencies.get_container.cache_info().currsize == 1
+
+    assert dependencies.get_container.cache_info().currsize == 0
+
+
 def test_get_all_videos():
     """Test getting all videos with auth"""
     headers = get_auth_headers()
@@ -95,6 +105,37 @@ def test_get_video_by_id_format():
             assert "data" in response.json()
 
 
+def test_get_video_returns_304_when_etag_matches(test_db, sample_video_data):
+    """Test conditional GET on a single video"""
+    headers = get_auth_headers(username="etaguser", password="pass123")
+    user = test_db.get_user_by_username("etaguser")
+    test_db.save_video(sample_video_data, user["id"])
+
+    first = client.get("/api/videos/test123", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    second = client.get("/api/videos/test123", headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+
+def test_get_video_etag_changes_when_summary_status_clears(test_db, sample_video_data):
+    """Test a failed background summary isn't hidden behind a stale 304"""
+    headers = get_auth_headers(username="etagpending", password="pass123")
+    user = test_db.get_user_by_username("etagpending")
+    test_db.save_video({**sample_video_data, "summary_status": "pending"}, user["id"])
+
+    first = client.get("/api/videos/test123", headers=headers)
+    etag = first.headers["etag"]
+
+    test_db.finish_summary("test123", None)
+
+    second = client.get("/api/videos/test123", headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.json()["data"]["summary_status"] is None
+
+
 def test_save_video_success_with_summary():
     """Test successfully saving video with AI summary"""
     headers = get_auth_headers(username="summarytest", password="pass123")
@@ -127,6 +168,46 @@ def test_save_video_success_with_summary():
         app.dependency_overrides.clear()
 
 
+def test_save_video_batch_reports_per_url_results():
+    """Test batch save returns one result per unique URL, including failures"""
+    headers = get_auth_headers()
+
+    def fake_prepare(url):
+        if "bad" in url:
+            return {"success": False, "error": "Transcript not found"}
+        return {"success": True, "video_data": {"video_id": url.rsplit("=", 1)[1]}}
+
+    mock_video_service = Mock(spec=VideoService)
+    mock_video_service.prepare_videos.side_effect = lambda urls, summarize=False: [
+        fake_prepare(url) for url in urls
+    ]
+    mock_video_service.save_videos.return_value = {
+        "success": True,
+        "data": [{"video_id": "good1"}],
+    }
+    mock_video_service.summarizer_available = False
+
+    app.dependency_overrides[get_video_service] = lambda: mock_video_service
+
+    try:
+        urls = [
+            "https://www.youtube.com/watch?v=good1",
+            "https://www.youtube.com/watch?v=bad1",
+            "https://www.youtube.com/watch?v=good1",
+        ]
+        response = client.post("/api/videos/batch", json={"urls": urls}, headers=headers)
+
+        assert response.status_code == 200
+        results = response.json()["data"]
+        assert [r["success"] for r in results] == [True, False]
+        assert results[0]["data"]["video_id"] == "good1"
+        assert results[1]["error"] == "Transcript not found"
+        mock_video_service.prepare_videos.assert_called_once_with(urls[:2], summarize=False)
+        mock_video_service.save_videos.assert_called_once()
+    finally:
+        app.dependency_overrides.clear()
+
+
 def test_save_video_transcript_failure():
     """Test saving video when transcript fetch fails"""
     headers = get_auth_headers()
@@ -477,6 +558,44 @@ def test_delete_video_success():
         app.dependency_overrides.clear()
 
 
+def test_get_video_reports_exhausted_db_pool_as_503():
+    """Test a pool timeout surfaces as 503 rather than a false 404"""
+    from backend.services.database import PoolTimeoutError
+
+    token = get_auth_token()
+
+    mock_video_service = Mock(spec=VideoService)
+    mock_video_service.get_video.side_effect = PoolTimeoutError("Timed out")
+
+    app.dependency_overrides[get_video_service] = lambda: mock_video_service
+
+    try:
+        response = client.get("/api/videos/busy", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_list_videos_reports_exhausted_db_pool_as_503():
+    """Test the list endpoint's catch-all doesn't turn a pool timeout into a 500"""
+    from backend.services.database import PoolTimeoutError
+
+    token = get_auth_token()
+
+    mock_video_service = Mock(spec=VideoService)
+    mock_video_service.get_user_videos.side_effect = PoolTimeoutError("Timed out")
+
+    app.dependency_overrides[get_video_service] = lambda: mock_video_service
+
+    try:
+        response = client.get("/api/videos", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+    finally:
+        app.dependency_overrides.clear()
+
+
 def test_delete_video_not_found():
     """Test deleting non-existent video"""
     token = get_auth_token()
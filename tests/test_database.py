@@ -54,6 +54,17 @@ def test_get_all_videos(test_db, sample_video_data):
     assert len(videos) == 2
 
 
+def test_get_videos_by_ids_returns_only_stored_videos(test_db, sample_video_data):
+    """Test the batch lookup finds stored videos and skips unknown IDs"""
+    test_db.save_video(sample_video_data, 1)
+
+    videos = test_db.get_videos_by_ids(["test123", "missing"])
+
+    assert [v["video_id"] for v in videos] == ["test123"]
+    assert "raw_transcript" not in videos[0]
+    assert test_db.get_videos_by_ids([]) == []
+
+
 def test_get_all_videos_empty(test_db):
     """Test get all videos when database is empty"""
     videos = test_db.get_all_videos()
@@ -232,6 +243,161 @@ def test_get_user_videos_empty(test_db):
     assert videos == []
 
 
+def test_get_user_videos_paginates(test_db, sample_video_data):
+    """Test limit/offset page through a user's videos"""
+    user_id = test_db.create_user("pageuser", "pass123")["data"]["id"]
+    for i in range(3):
+        test_db.save_video(dict(sample_video_data, video_id=f"page{i}", url=f"u{i}"), user_id)
+
+    assert len(test_db.get_user_videos(user_id, limit=2)) == 2
+    assert len(test_db.get_user_videos(user_id, limit=2, offset=2)) == 1
+    assert "raw_transcript" not in test_db.get_user_videos(user_id)[0]
+
+
+def test_get_user_videos_keyset_pages(test_db, sample_video_data):
+    """Test keyset pages continue after the given row without gaps or repeats"""
+    user_id = test_db.create_user("keysetuser", "pass123")["data"]["id"]
+    for i in range(5):
+        test_db.save_video(dict(sample_video_data, video_id=f"ks{i}", url=f"ks{i}"), user_id)
+
+    seen = []
+    page = test_db.get_user_videos(user_id, limit=2)
+    while page:
+        seen.extend(video["video_id"] for video in page)
+        last = page[-1]
+        page = test_db.get_user_videos(user_id, limit=2, before=(last["created_at"], last["id"]))
+
+    assert seen == [video["video_id"] for video in test_db.get_user_videos(user_id)]
+    assert len(seen) == 5
+
+
+def test_get_user_videos_full_includes_transcripts(test_db, sample_video_data):
+    """Test the full listing pages like the list view but returns whole rows"""
+    user_id = test_db.create_user("fulluser", "pass123")["data"]["id"]
+    for i in range(3):
+        test_db.save_video(dict(sample_video_data, video_id=f"full{i}", url=f"full{i}"), user_id)
+
+    page = test_db.get_user_videos_full(user_id, limit=2)
+    assert [v["video_id"] for v in page] == [
+        v["video_id"] for v in test_db.get_user_videos(user_id, limit=2)
+    ]
+    assert page[0]["raw_transcript"] == sample_video_data["raw_transcript"]
+
+    last = page[-1]
+    rest = test_db.get_user_videos_full(user_id, limit=2, before=(last["created_at"], last["id"]))
+    assert len(rest) == 1
+
+
+def test_long_transcripts_are_stored_compressed(test_db, sample_video_data):
+    """Test long transcripts are written as compressed BLOBs and read back as text"""
+    transcript = "the same words again and again " * 200
+    test_db.save_video(dict(sample_video_data, raw_transcript=transcript), 1)
+
+    with test_db._connect() as conn:
+        stored_type, stored_size = conn.execute(
+            "SELECT typeof(raw_transcript), length(raw_transcript) FROM saved_videos"
+        ).fetchone()
+    assert stored_type == "blob"
+    assert stored_size < len(transcript) / 3
+
+    assert test_db.get_video_by_id("test123")["raw_transcript"] == transcript
+    assert test_db.get_user_videos_full(1)[0]["raw_transcript"] == transcript
+
+
+def test_get_user_videos_uses_composite_index(test_db):
+    """Test the user listing is served by idx_user_created without a sort step"""
+    from backend.services.database import _SQL_GET_USER_VIDEOS
+
+    with test_db._connect() as conn:
+        plan = " ".join(
+            row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {_SQL_GET_USER_VIDEOS}", (1, -1, 0))
+        )
+
+    assert "USING INDEX idx_user_created" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_get_user_videos_keyset_uses_composite_index(test_db):
+    """Test keyset pages are an index range scan without a sort step"""
+    from backend.services.database import _SQL_GET_USER_VIDEOS_BEFORE
+
+    with test_db._connect() as conn:
+        plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                f"EXPLAIN QUERY PLAN {_SQL_GET_USER_VIDEOS_BEFORE}", (1, "", 0, -1, 0)
+            )
+        )
+
+    assert "USING INDEX idx_user_created" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_save_videos_bulk_insert(test_db, sample_video_data):
+    """Test saving several videos in one transaction"""
+    user_id = test_db.create_user("bulkuser", "pass123")["data"]["id"]
+    videos = [dict(sample_video_data, video_id=f"bulk{i}", url=f"u{i}") for i in range(3)]
+
+    result = test_db.save_videos(videos, user_id)
+
+    assert result["success"] == True
+    assert {v["video_id"] for v in result["data"]} == {"bulk0", "bulk1", "bulk2"}
+    assert len(test_db.get_user_videos(user_id)) == 3
+
+
+def test_save_videos_chunks_large_batches(test_db, sample_video_data):
+    """Test batches above the per-statement row limit are split into chunks"""
+    from backend.services.database import _BULK_INSERT_CHUNK
+
+    count = _BULK_INSERT_CHUNK * 2 + 3
+    videos = [dict(sample_video_data, video_id=f"big{i}", url=f"u{i}") for i in range(count)]
+
+    result = test_db.save_videos(videos, 1)
+
+    assert result["success"] == True
+    assert result["inserted"] == count
+    assert len(result["data"]) == count
+
+
+def test_save_videos_is_all_or_nothing(test_db, sample_video_data):
+    """Test a duplicate in the batch rolls back the whole insert"""
+    test_db.save_video(sample_video_data, 1)
+    fresh = dict(sample_video_data, video_id="fresh1", url="u-fresh")
+
+    result = test_db.save_videos([fresh, sample_video_data], 1)
+
+    assert result["success"] == False
+    assert "already exists" in result["error"].lower()
+    assert test_db.get_video_by_id("fresh1") is None
+
+
+def test_save_videos_skip_existing_ignores_duplicates(test_db, sample_video_data):
+    """Test skip_existing inserts the new videos and keeps the stored ones"""
+    test_db.save_video(sample_video_data, 1)
+    fresh = dict(sample_video_data, video_id="fresh2", url="u-fresh2")
+
+    result = test_db.save_videos([fresh, sample_video_data], 1, skip_existing=True)
+
+    assert result["success"] == True
+    assert result["inserted"] == 1
+    assert {v["video_id"] for v in result["data"]} == {"fresh2", "test123"}
+    assert test_db.get_video_by_id("fresh2") is not None
+
+
+def test_finish_summary_stores_summary_and_clears_pending(test_db, sample_video_data):
+    """Test the pending summary status is kept in the row until finish_summary"""
+    test_db.save_video(dict(sample_video_data, ai_summary=None, summary_status="pending"), 1)
+    assert test_db.get_video_by_id("test123")["summary_status"] == "pending"
+
+    result = test_db.finish_summary("test123", None)
+    assert result["data"]["summary_status"] is None
+    assert result["data"]["ai_summary"] is None
+
+    result = test_db.finish_summary("test123", "notes")
+    assert result["data"]["ai_summary"] == "notes"
+    assert test_db.finish_summary("missing", "x")["success"] == False
+
+
 def test_delete_video(test_db, sample_video_data):
     """Test deleting a video"""
     user_result = test_db.create_user("deleteuser", "pass123")
@@ -246,6 +412,18 @@ def test_delete_video(test_db, sample_video_data):
     assert video is None
 
 
+def test_owner_scoped_writes_skip_other_users_videos(test_db, sample_video_data):
+    """Test delete/update with user_id only touch that user's video"""
+    test_db.save_video(sample_video_data, 1)
+
+    assert test_db.update_video("test123", {"title": "x"}, user_id=2)["success"] == False
+    assert test_db.delete_video("test123", user_id=2)["success"] == False
+    assert test_db.get_video_by_id("test123")["title"] is None
+
+    assert test_db.update_video("test123", {"title": "mine"}, user_id=1)["data"]["title"] == "mine"
+    assert test_db.delete_video("test123", user_id=1)["success"] == True
+
+
 def test_delete_nonexistent_video(test_db):
     """Test deleting video that doesn't exist"""
     result = test_db.delete_video("nonexistent")
@@ -264,6 +442,19 @@ def test_update_video_summary(test_db, sample_video_data):
     assert result["data"]["ai_summary"] == "Updated summary"
 
 
+def test_update_video_leaves_other_fields_untouched(test_db, sample_video_data):
+    """Test updating one field keeps the others and can clear a field"""
+    test_db.save_video(sample_video_data, 1)
+
+    result = test_db.update_video("test123", {"title": "New title"})
+    assert result["data"]["title"] == "New title"
+    assert result["data"]["ai_summary"] == "Test summary"
+
+    result = test_db.update_video("test123", {"ai_summary": None})
+    assert result["data"]["ai_summary"] is None
+    assert result["data"]["title"] == "New title"
+
+
 def test_update_video_no_valid_fields(test_db, sample_video_data):
     """Test updating with invalid fields"""
     user_result = test_db.create_user("noupdateuser", "pass123")
@@ -1,9 +1,10 @@
+import asyncio
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from backend.services.groq_summarizer import GroqSummarizer
+from backend.services.groq_summarizer import GroqSummarizer, truncate_to_tokens
 
 
 def test_groq_summarizer_initialization():
@@ -83,3 +84,82 @@ def test_summarize_api_error(mock_groq):
 
     assert result["success"] == False
     assert "error" in result
+
+
+@patch("backend.services.groq_summarizer.Groq")
+def test_summarize_reuses_cached_summary(mock_groq):
+    """Test identical transcripts are summarized once"""
+    os.environ["GROQ_API_KEY"] = "test_key"
+
+    mock_response = Mock()
+    mock_response.choices = [Mock()]
+    mock_response.choices[0].message.content = "Cached summary"
+
+    mock_client = Mock()
+    mock_client.chat.completions.create.return_value = mock_response
+    mock_groq.return_value = mock_client
+
+    summarizer = GroqSummarizer()
+    first = summarizer.summarize("Same transcript")
+    second = summarizer.summarize("Same transcript")
+
+    assert first == second == {"success": True, "summary": "Cached summary"}
+    mock_client.chat.completions.create.assert_called_once()
+
+
+def test_truncate_to_tokens_counts_tokens_not_characters():
+    """Test token truncation keeps short text and cuts long text by token budget"""
+    assert truncate_to_tokens("short text", 100) == "short text"
+    assert truncate_to_tokens("one two three four", 2) == "one two"
+    # Non-Latin characters count as a token each
+    assert truncate_to_tokens("日本語のテキスト", 3) == "日本語"
+
+
+@patch("backend.services.groq_summarizer.AsyncGroq")
+@patch("backend.services.groq_summarizer.Groq")
+def test_summarize_many_uses_async_client(mock_groq, mock_async_groq):
+    """Test batch summarization goes through the async client, one call per transcript"""
+    os.environ["GROQ_API_KEY"] = "test_key"
+
+    def make_response(**kwargs):
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = f"Summary of {kwargs['messages'][1]['content'][-40:]}"
+        return response
+
+    mock_async_client = Mock()
+    mock_async_client.chat.completions.create = AsyncMock(side_effect=make_response)
+    mock_async_groq.return_value = mock_async_client
+
+    summarizer = GroqSummarizer()
+    results = asyncio.run(summarizer.summarize_many(["first", "second", ""]))
+
+    assert [r["success"] for r in results] == [True, True, False]
+    assert mock_async_client.chat.completions.create.await_count == 2
+    mock_groq.return_value.chat.completions.create.assert_not_called()
+
+
+@patch("backend.services.groq_summarizer.Groq")
+def test_summarize_stream_yields_chunks_and_caches_result(mock_groq):
+    """Test streamed summaries arrive in chunks and are cached when complete"""
+    os.environ["GROQ_API_KEY"] = "test_key"
+
+    def chunk(text):
+        c = Mock()
+        c.choices = [Mock()]
+        c.choices[0].delta.content = text
+        return c
+
+    mock_client = Mock()
+    mock_client.chat.completions.create.return_value = iter(
+        [chunk("Hello"), chunk(None), chunk(" world")]
+    )
+    mock_groq.return_value = mock_client
+
+    summarizer = GroqSummarizer()
+    assert list(summarizer.summarize_stream("Streamed transcript")) == ["Hello", " world"]
+    assert mock_client.chat.completions.create.call_args[1]["stream"] is True
+
+    result = summarizer.summarize("Streamed transcript")
+    assert result == {"success": True, "summary": "Hello world"}
+    mock_client.chat.completions.create.assert_called_once()
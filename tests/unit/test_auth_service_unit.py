@@ -67,6 +67,24 @@ def test_login_wrong_password():
     assert "invalid" in result["error"].lower()
 
 
+def test_login_unknown_user_is_remembered_until_signup():
+    repo = Mock()
+    repo.get_user_by_username.return_value = None
+    repo.create_user.return_value = {"success": True, "data": {"id": 5, "username": "dave"}}
+
+    service = AuthService(repo)
+    assert service.login("dave", "pw")["success"] is False
+    assert service.login("dave", "pw")["success"] is False
+    repo.get_user_by_username.assert_called_once_with("dave")
+
+    with patch("backend.services.user_service.get_password_hash", return_value="hashed"):
+        assert service.signup("dave", "pw")["success"] is True
+
+    repo.get_user_by_username.return_value = {"id": 5, "username": "dave", "hashed_password": "h"}
+    with patch("backend.services.user_service.verify_password", return_value=True):
+        assert service.login("dave", "pw")["success"] is True
+
+
 def test_get_user_info_delegates_to_repo():
     repo = Mock()
     repo.get_user_by_id.return_value = {"id": 9, "username": "x"}
@@ -76,3 +94,45 @@ def test_get_user_info_delegates_to_repo():
 
     assert out == {"id": 9, "username": "x"}
     repo.get_user_by_id.assert_called_once_with(9)
+
+
+def test_cached_verify_token_skips_repeat_decode():
+    from backend.services import auth_service
+
+    auth_service.clear_token_cache()
+    token = auth_service.create_access_token({"sub": "carol", "user_id": 7})
+
+    with patch(
+        "backend.services.auth_service._decode_token", wraps=auth_service._decode_token
+    ) as decode:
+        first = auth_service.cached_verify_token(token)
+        second = auth_service.cached_verify_token(token)
+
+    assert first == {"username": "carol", "user_id": 7}
+    assert second == first
+    decode.assert_called_once()
+
+
+def test_cached_verify_token_does_not_cache_failures():
+    from backend.services import auth_service
+
+    auth_service.clear_token_cache()
+    with patch("backend.services.auth_service._decode_token", return_value=None) as decode:
+        assert auth_service.cached_verify_token("bogus") is None
+        assert auth_service.cached_verify_token("bogus") is None
+
+    assert decode.call_count == 2
+
+
+def test_verify_password_caches_successes_only():
+    from backend.services import auth_service
+
+    with patch.object(auth_service.bcrypt, "checkpw", return_value=True) as verify:
+        assert auth_service.verify_password("secret", "hash-a") is True
+        assert auth_service.verify_password("secret", "hash-a") is True
+    verify.assert_called_once()
+
+    with patch.object(auth_service.bcrypt, "checkpw", return_value=False) as verify:
+        assert auth_service.verify_password("wrong", "hash-a") is False
+        assert auth_service.verify_password("wrong", "hash-a") is False
+    assert verify.call_count == 2
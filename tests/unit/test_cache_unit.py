@@ -0,0 +1,21 @@
+from backend.services.cache import MemoryCache
+
+
+def test_memory_cache_get_set_delete():
+    cache = MemoryCache(maxsize=8)
+    assert cache.get("k") is None
+
+    cache.set("k", b"value")
+    assert cache.get("k") == b"value"
+
+    cache.delete("k")
+    assert cache.get("k") is None
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache(maxsize=8, default_ttl=60)
+    cache.set("fresh", 1)
+    cache.set("stale", 2, ttl=0)
+
+    assert cache.get("fresh") == 1
+    assert cache.get("stale") is None
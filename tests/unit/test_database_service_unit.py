@@ -60,3 +60,50 @@ def test_save_video_integrity_error_is_mapped(monkeypatch):
 
     assert res["success"] is False
     assert "already exists" in res["error"].lower()
+
+
+def test_user_lookups_are_cached_until_invalidated():
+    db = DatabaseService(db_path=":memory:")
+    user_id = db.create_user("erin", "hashed")["data"]["id"]
+
+    assert db.get_user_by_id(user_id)["username"] == "erin"
+    assert db.get_user_by_username("erin")["hashed_password"] == "hashed"
+
+    def raise_connect(self):  # pragma: no cover - tiny utility
+        raise Exception("DB down")
+
+    # Lookups by id are served from the cache; rows with the password hash never are
+    db._connect = raise_connect.__get__(db)
+    assert db.get_user_by_id(user_id)["username"] == "erin"
+    assert db.get_user_by_username("erin") is None
+
+    db.invalidate_user(user_id)
+    assert db.get_user_by_id(user_id) is None
+
+
+def test_reads_propagate_pool_timeouts(monkeypatch):
+    from backend.services import database
+
+    monkeypatch.setattr(database, "POOL_TIMEOUT_SECONDS", 0.01)
+    db = DatabaseService(db_path=":memory:")
+    db._pool.get()  # exhaust the pool
+
+    with pytest.raises(database.PoolTimeoutError):
+        db.get_video_by_id("any")
+    with pytest.raises(database.PoolTimeoutError):
+        db.get_user_videos(user_id=1)
+
+
+def test_writes_propagate_pool_timeouts(monkeypatch):
+    from backend.services import database
+
+    monkeypatch.setattr(database, "POOL_TIMEOUT_SECONDS", 0.01)
+    db = DatabaseService(db_path=":memory:")
+    db._pool.get()  # exhaust the pool
+
+    with pytest.raises(database.PoolTimeoutError):
+        db.save_video({"video_id": "v1", "url": "u", "raw_transcript": "t"}, user_id=1)
+    with pytest.raises(database.PoolTimeoutError):
+        db.create_user("alice", "hash")
+    with pytest.raises(database.PoolTimeoutError):
+        db.update_video("v1", {"title": "New"})
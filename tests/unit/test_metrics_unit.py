@@ -0,0 +1,37 @@
+import time
+
+from backend.metrics import FLUSH_THRESHOLD, MetricsService
+
+
+def _sample_count(service, **labels):
+    return service.registry.get_sample_value("http_requests_total", labels)
+
+
+def test_record_request_is_buffered_until_flush():
+    service = MetricsService()
+    service.record_request("GET", "/api/videos", 200, time.perf_counter())
+
+    assert _sample_count(service, method="GET", path="/api/videos", status_code="200") is None
+
+    service.flush()
+
+    assert _sample_count(service, method="GET", path="/api/videos", status_code="200") == 1.0
+
+
+def test_metrics_response_includes_buffered_samples():
+    service = MetricsService()
+    service.record_request("POST", "/api/login", 401, time.perf_counter())
+
+    body = b"".join(service.iter_metrics()).decode()
+
+    assert 'http_errors_total{method="POST",path="/api/login",status_code="401"} 1.0' in body
+
+
+def test_buffer_flushes_inline_at_threshold():
+    service = MetricsService()
+    for _ in range(FLUSH_THRESHOLD):
+        service.record_request("GET", "/api/health", 200, time.perf_counter())
+
+    assert _sample_count(service, method="GET", path="/api/health", status_code="200") == float(
+        FLUSH_THRESHOLD
+    )
@@ -0,0 +1,187 @@
+from unittest.mock import Mock
+
+import pytest
+
+from backend.services.video_service import (
+    TRANSCRIPT_PAGE_SIZE,
+    VideoService,
+    encode_page_cursor,
+)
+
+
+def _transcript_result():
+    return {
+        "success": True,
+        "video_id": "abc123",
+        "transcript": "hello world",
+        "segments_count": 2,
+        "language": "en",
+        "is_generated": False,
+    }
+
+
+def test_save_video_can_defer_summary():
+    fetcher = Mock()
+    fetcher.extract_video_id.return_value = "abc123"
+    fetcher.get_transcript.return_value = _transcript_result()
+    repo = Mock()
+    repo.get_video_by_id.return_value = None
+    repo.save_video.return_value = {"success": True, "data": {"video_id": "abc123"}}
+    summarizer = Mock()
+
+    service = VideoService(fetcher=fetcher, repository=repo, summarizer=summarizer)
+    result = service.save_video("https://www.youtube.com/watch?v=abc123", 1, summarize=False)
+
+    assert result["success"] is True
+    fetcher.get_transcript.assert_called_once_with(
+        "https://www.youtube.com/watch?v=abc123", video_id="abc123"
+    )
+    summarizer.summarize.assert_not_called()
+    saved_data = repo.save_video.call_args[0][0]
+    assert saved_data["ai_summary"] is None
+    assert saved_data["summary_status"] == "pending"
+
+
+def test_summarize_video_updates_summary():
+    repo = Mock()
+    repo.get_video_by_id.return_value = {"video_id": "abc123", "raw_transcript": "hello"}
+    repo.finish_summary.return_value = {"success": True, "data": {"ai_summary": "notes"}}
+    summarizer = Mock()
+    summarizer.summarize.return_value = {"success": True, "summary": "notes"}
+
+    service = VideoService(fetcher=Mock(), repository=repo, summarizer=summarizer)
+    result = service.summarize_video("abc123")
+
+    assert result["success"] is True
+    summarizer.summarize.assert_called_once_with("hello")
+    repo.finish_summary.assert_called_once_with("abc123", "notes")
+
+
+def test_summarize_video_failure_still_ends_pending_status():
+    repo = Mock()
+    repo.get_video_by_id.return_value = {"video_id": "abc123", "raw_transcript": "hello"}
+    summarizer = Mock()
+    summarizer.summarize.return_value = {"success": False, "error": "rate limited"}
+
+    service = VideoService(fetcher=Mock(), repository=repo, summarizer=summarizer)
+    result = service.summarize_video("abc123")
+
+    assert result == {"success": False, "error": "rate limited"}
+    repo.finish_summary.assert_called_once_with("abc123", None)
+
+
+def test_summarize_video_without_summarizer():
+    service = VideoService(fetcher=Mock(), repository=Mock(), summarizer=None)
+
+    result = service.summarize_video("abc123")
+
+    assert result["success"] is False
+    assert service.summarizer_available is False
+
+
+def test_get_video_status_reads_summary_status_from_the_row():
+    video = {"video_id": "abc123", "user_id": 1, "ai_summary": None, "summary_status": "pending"}
+    repo = Mock()
+    repo.get_video_by_id.return_value = video
+    service = VideoService(fetcher=Mock(), repository=repo)
+
+    assert service.get_video_status("abc123", 1)["summary_status"] == "pending"
+    assert service.get_video_status("abc123", 2) is None
+
+    video["summary_status"] = None
+    assert service.get_video_status("abc123", 1)["summary_status"] == "unavailable"
+
+    video["ai_summary"] = "notes"
+    assert service.get_video_status("abc123", 1)["summary_status"] == "ready"
+
+
+def test_get_user_videos_decodes_page_cursor():
+    repo = Mock()
+    repo.get_user_videos.return_value = []
+    service = VideoService(fetcher=Mock(), repository=repo)
+
+    cursor = encode_page_cursor({"id": 7, "created_at": "2025-01-02 03:04:05"})
+    service.get_user_videos(1, limit=10, cursor=cursor)
+
+    repo.get_user_videos.assert_called_once_with(
+        1, limit=10, offset=0, before=("2025-01-02 03:04:05", 7)
+    )
+    with pytest.raises(ValueError):
+        service.get_user_videos(1, limit=10, cursor="not-a-cursor")
+
+
+def test_get_user_videos_with_transcripts_is_paged_by_default():
+    repo = Mock()
+    repo.get_user_videos_full.return_value = []
+    service = VideoService(fetcher=Mock(), repository=repo)
+
+    service.get_user_videos(1, with_transcripts=True)
+
+    repo.get_user_videos_full.assert_called_once_with(
+        1, limit=TRANSCRIPT_PAGE_SIZE, offset=0, before=None
+    )
+    repo.get_user_videos.assert_not_called()
+
+
+def test_prepare_videos_prefilters_existing_and_fetches_the_rest_once():
+    fetcher = Mock()
+    fetcher.extract_video_id.side_effect = lambda url: url.rsplit("=", 1)[1]
+    fetcher.get_transcripts.side_effect = lambda urls, video_ids: [
+        dict(_transcript_result(), video_id=video_id) for video_id in video_ids
+    ]
+    repo = Mock()
+    repo.get_videos_by_ids.return_value = [{"video_id": "old"}]
+    service = VideoService(fetcher=fetcher, repository=repo)
+
+    results = service.prepare_videos(["u?v=old", "u?v=new", "u2?v=new"])
+
+    assert results[0] == {
+        "success": True,
+        "message": "Video already exists",
+        "data": {"video_id": "old"},
+    }
+    assert results[1]["video_data"]["video_id"] == "new"
+    assert results[2] is results[1]
+    fetcher.get_transcripts.assert_called_once_with(["u?v=new"], video_ids=["new"])
+    repo.get_videos_by_ids.assert_called_once()
+    repo.get_video_by_id.assert_not_called()
+
+
+def test_delete_and_update_are_owner_scoped_in_one_call():
+    repo = Mock()
+    repo.delete_video.return_value = {"success": True}
+    repo.update_video.return_value = {"success": True, "data": {"title": "t"}}
+    service = VideoService(fetcher=Mock(), repository=repo)
+
+    assert service.delete_video("vid", 1) == {"success": True}
+    assert service.update_video("vid", 1, {"title": "t"})["success"] is True
+    repo.delete_video.assert_called_once_with("vid", user_id=1)
+    repo.update_video.assert_called_once_with("vid", {"title": "t"}, user_id=1)
+    repo.get_video_by_id.assert_not_called()
+
+
+def test_owner_scoped_miss_distinguishes_missing_from_denied():
+    repo = Mock()
+    repo.delete_video.return_value = {"success": False, "error": "Video not found"}
+    service = VideoService(fetcher=Mock(), repository=repo)
+
+    repo.get_video_by_id.return_value = {"video_id": "vid", "user_id": 2}
+    assert service.delete_video("vid", 1)["error"] == "Access denied"
+
+    repo.get_video_by_id.return_value = None
+    assert service.delete_video("vid", 1)["error"] == "Video not found"
+
+
+def test_update_without_valid_fields_still_checks_ownership():
+    repo = Mock()
+    repo.update_video.return_value = {"success": False, "error": "No valid fields to update"}
+    service = VideoService(fetcher=Mock(), repository=repo)
+
+    repo.get_video_by_id.return_value = {"video_id": "vid", "user_id": 2}
+    assert service.update_video("vid", 1, {"junk": 1})["error"] == "Access denied"
+
+    repo.get_video_by_id.return_value = None
+    assert service.update_video("vid", 1, {"junk": 1})["error"] == "Video not found"
+
+    repo.get_video_by_id.return_value = {"video_id": "vid", "user_id": 1}
+    assert service.update_video("vid", 1, {"junk": 1})["error"] == "No valid fields to update"
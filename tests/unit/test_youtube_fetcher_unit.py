@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock, patch
 
 from backend.services.youtube_fetcher import YouTubeFetcher
@@ -45,3 +46,101 @@ def test_get_transcript_success_with_mocked_snippets_object():
         assert result["segments_count"] == 3
         assert result["language"] == "en"
         assert result["is_generated"] is True
+
+
+def test_get_transcripts_fetches_concurrently_in_input_order():
+    client = Mock()
+    client.fetch.side_effect = lambda video_id, languages: [{"text": f"text-{video_id}"}]
+
+    fetcher = YouTubeFetcher(client=client)
+    results = fetcher.get_transcripts(
+        [
+            "https://www.youtube.com/watch?v=first",
+            "https://youtu.be/second",
+            "not a url",
+        ]
+    )
+
+    assert [r["success"] for r in results] == [True, True, False]
+    assert [r["transcript"] for r in results[:2]] == ["text-first", "text-second"]
+    assert client.fetch.call_count == 2
+
+
+def test_get_transcripts_uses_known_video_ids():
+    client = Mock()
+    client.fetch.side_effect = lambda video_id, languages: [{"text": video_id}]
+
+    fetcher = YouTubeFetcher(client=client)
+    with patch.object(fetcher, "extract_video_id") as extract:
+        results = fetcher.get_transcripts(
+            ["https://youtu.be/one", "https://youtu.be/two"], video_ids=["one", "two"]
+        )
+
+    assert [r["transcript"] for r in results] == ["one", "two"]
+    extract.assert_not_called()
+
+
+def test_get_transcript_async_runs_fetch_on_pool():
+    client = Mock()
+    client.fetch.return_value = [{"text": "async"}]
+
+    fetcher = YouTubeFetcher(client=client)
+    result = asyncio.run(fetcher.get_transcript_async("https://youtu.be/abc"))
+
+    assert result["success"] is True
+    assert result["transcript"] == "async"
+    client.fetch.assert_called_once()
+
+
+def test_get_transcript_caches_successes_only():
+    client = Mock()
+    client.fetch.return_value = [{"text": "cached"}]
+
+    fetcher = YouTubeFetcher(client=client)
+    first = fetcher.get_transcript("https://www.youtube.com/watch?v=cache1")
+    second = fetcher.get_transcript("https://youtu.be/cache1")
+
+    assert second == first
+    assert second["transcript"] == "cached"
+    client.fetch.assert_called_once()
+
+    client.fetch.side_effect = Exception("Too Many Requests")
+    assert fetcher.get_transcript("https://youtu.be/fail1")["success"] is False
+    assert fetcher.get_transcript("https://youtu.be/fail1")["success"] is False
+    assert client.fetch.call_count == 3
+
+
+def test_get_transcript_retries_transient_errors_only():
+    client = Mock()
+    client.fetch.side_effect = [ConnectionError("reset"), [{"text": "after retry"}]]
+
+    with patch("backend.services.youtube_fetcher.time.sleep") as sleep:
+        fetcher = YouTubeFetcher(client=client)
+        result = fetcher.get_transcript("https://youtu.be/retry1")
+
+        assert result["transcript"] == "after retry"
+        assert client.fetch.call_count == 2
+        sleep.assert_called_once()
+
+        client.fetch.side_effect = ValueError("Transcripts are disabled")
+        assert fetcher.get_transcript("https://youtu.be/permanent1")["success"] is False
+        assert client.fetch.call_count == 3
+
+
+def test_extract_video_id_supports_other_url_shapes():
+    fetcher = YouTubeFetcher(client=Mock())
+
+    assert fetcher.extract_video_id("https://www.youtube.com/shorts/abc_DEF-123") == "abc_DEF-123"
+    assert fetcher.extract_video_id("https://www.youtube.com/embed/xyz789?start=5") == "xyz789"
+    assert fetcher.extract_video_id("https://youtube.com/watch?feature=share&v=id42") == "id42"
+    assert fetcher.extract_video_id("https://youtube.com/watch?dev=1&v=real1") == "real1"
+
+
+def test_can_handle_matches_youtube_hosts_only():
+    fetcher = YouTubeFetcher(client=Mock())
+
+    assert fetcher.can_handle("https://m.youtube.com/watch?v=abc") is True
+    assert fetcher.can_handle("HTTPS://WWW.YOUTUBE.COM/watch?v=abc") is True
+    assert fetcher.can_handle("youtu.be/abc") is True
+    assert fetcher.can_handle("https://example.com/?ref=youtube.com") is False
+    assert fetcher.can_handle("https://notyoutube.company/watch") is False